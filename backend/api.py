@@ -1439,6 +1439,7 @@ def parse_comprehensive_resumes():
             sys.path.insert(0, utils_path)
 
         from comprehensive_resume_parser import parse_comprehensive_resume
+        from comprehensive_resume_parser import parse_comprehensive_resumes as parse_resume_batch
 
         # Check if file was uploaded
         if 'file' not in request.files:
@@ -1494,7 +1495,8 @@ def parse_comprehensive_resumes():
                         shutil.rmtree(extract_dir, ignore_errors=True)
                     return jsonify({'error': error_msg}), 400
 
-                # Process each file in the zip
+                # Extract text from each file in the zip
+                resume_entries = []
                 for root, dirs, files in os.walk(extract_dir):
                     for resume_file in files:
                         if allowed_file(resume_file):
@@ -1502,41 +1504,44 @@ def parse_comprehensive_resumes():
                             resume_text = extract_text_from_file(resume_path)
 
                             if resume_text:
-                                # Parse comprehensively
-                                candidate_data = parse_comprehensive_resume(resume_text, use_ai=use_ai)
-
-                                # Add filename for reference
-                                candidate_data['filename'] = resume_file
-
-                                # Calculate match score if requested
-                                if calculate_score and job_requirements:
-                                    score_result = score_candidate_resume(resume_text, job_requirements)
-                                    candidate_data['score'] = score_result['score']
-                                    candidate_data['matchScore'] = score_result['score']
-                                else:
-                                    # Default score based on data completeness
-                                    completeness = sum([
-                                        bool(candidate_data.get('email')),
-                                        bool(candidate_data.get('phone')),
-                                        bool(candidate_data.get('education')),
-                                        bool(candidate_data.get('skills')),
-                                        bool(candidate_data.get('github')) or bool(candidate_data.get('linkedin')),
-                                        candidate_data.get('experience_years', 0) > 0,
-                                        candidate_data.get('cgpa', 0) > 0
-                                    ])
-                                    candidate_data['score'] = int((completeness / 7) * 100)
-                                    candidate_data['matchScore'] = candidate_data['score']
-
-                                # Format experience and projects for display
-                                candidate_data['exp'] = f"{candidate_data.get('experience_years', 0)} yrs"
-                                candidate_data['projects'] = candidate_data.get('projects_count', 0)
-
-                                # Format note
-                                skills_count = len(candidate_data.get('skills', []))
-                                candidate_data['note'] = candidate_data.get('summary', '') or \
-                                                        f"Proficient in {skills_count}+ technologies"
+                                resume_entries.append((resume_file, resume_text))
 
-                                candidates.append(candidate_data)
+                # Parse comprehensively (AI requests are batched across resumes)
+                parsed_resumes = parse_resume_batch([text for _, text in resume_entries], use_ai=use_ai)
+
+                for (resume_file, resume_text), candidate_data in zip(resume_entries, parsed_resumes):
+                    # Add filename for reference
+                    candidate_data['filename'] = resume_file
+
+                    # Calculate match score if requested
+                    if calculate_score and job_requirements:
+                        score_result = score_candidate_resume(resume_text, job_requirements)
+                        candidate_data['score'] = score_result['score']
+                        candidate_data['matchScore'] = score_result['score']
+                    else:
+                        # Default score based on data completeness
+                        completeness = sum([
+                            bool(candidate_data.get('email')),
+                            bool(candidate_data.get('phone')),
+                            bool(candidate_data.get('education')),
+                            bool(candidate_data.get('skills')),
+                            bool(candidate_data.get('github')) or bool(candidate_data.get('linkedin')),
+                            candidate_data.get('experience_years', 0) > 0,
+                            candidate_data.get('cgpa', 0) > 0
+                        ])
+                        candidate_data['score'] = int((completeness / 7) * 100)
+                        candidate_data['matchScore'] = candidate_data['score']
+
+                    # Format experience and projects for display
+                    candidate_data['exp'] = f"{candidate_data.get('experience_years', 0)} yrs"
+                    candidate_data['projects'] = candidate_data.get('projects_count', 0)
+
+                    # Format note
+                    skills_count = len(candidate_data.get('skills', []))
+                    candidate_data['note'] = candidate_data.get('summary', '') or \
+                                            f"Proficient in {skills_count}+ technologies"
+
+                    candidates.append(candidate_data)
 
                 # Cleanup extracted directory
                 shutil.rmtree(extract_dir, ignore_errors=True)
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Test Script for the Regex Fallback Parser
+Checks that each contact field is found independently of the others
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'utils'))
+
+from comprehensive_resume_parser import ComprehensiveResumeParser
+from contact_extractor import extract_contacts
+
+_PARSER = ComprehensiveResumeParser(use_ai=False)
+
+
+def test_cgpa_label_does_not_hide_experience():
+    """A CGPA label followed by experience still yields the experience"""
+    result = _PARSER.parse_with_regex("CGPA: 3+ yrs exp")
+    assert result['experience_years'] == 3
+    assert result['cgpa'] == 3.0
+
+
+def test_cgpa_label_does_not_split_phone():
+    """A CGPA label in front of a phone number keeps the full number"""
+    result = _PARSER.parse_with_regex("CGPA: 555-123-4567")
+    assert result['phone'] == "555-123-4567"
+    assert result['cgpa'] == 555.0
+
+
+def test_email_and_profiles_alongside_each_other():
+    """Emails, profile links and phones on one line are all reported"""
+    text = "jane@example.com | github.com/janedev | linkedin.com/in/jane | +1 555-123-4567"
+    result = _PARSER.parse_with_regex(text)
+    assert result['email'] == "jane@example.com"
+    assert result['github'] == "janedev"
+    assert result['linkedin'] == "jane"
+    assert result['phone'] == "+1 555-123-4567"
+
+
+def test_phone_inside_email_matches_contact_extractor():
+    """Both extractors report a phone number that is part of an email"""
+    text = "9876543210@gmail.com"
+    result = _PARSER.parse_with_regex(text)
+    contacts = extract_contacts(text)
+    assert result['email'] == "9876543210@gmail.com"
+    assert result['phone'] == "9876543210"
+    assert contacts['emails'] == ["9876543210@gmail.com"]
+    assert contacts['phones'] == ["9876543210"]
+
+
+if __name__ == '__main__':
+    tests = [
+        test_cgpa_label_does_not_hide_experience,
+        test_cgpa_label_does_not_split_phone,
+        test_email_and_profiles_alongside_each_other,
+        test_phone_inside_email_matches_contact_extractor,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ {test.__name__}: {e}")
+    sys.exit(1 if failed else 0)
@@ -4,20 +4,62 @@ Test Script for Dynamic Leaderboard System
 Demonstrates the complete workflow
 """
 
+import io
+import sys
 import requests
 import json
 import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
 # Configuration
 BASE_URL = "http://localhost:5000"
 API_KEY = None  # Set if API keys are enabled
+STREAM_MIN_TOP_N = 20  # Below this, a plain response.json() is cheaper than streaming
+
+# Banner rules, built once
+_BAR70 = "=" * 70
+_DASH90 = "-" * 90
+
+class _ThreadOutput(io.TextIOBase):
+    """
+    sys.stdout stand-in that routes each worker thread's output to its own buffer
+    
+    Threads without a buffer (the main thread) write straight through, so
+    concurrently run tests can't interleave their reports.
+    """
+    
+    def __init__(self, stream):
+        self.stream = stream
+        self._local = threading.local()
+    
+    def write(self, text):
+        buffer = getattr(self._local, 'buffer', None)
+        return (self.stream if buffer is None else buffer).write(text)
+    
+    def flush(self):
+        self.stream.flush()
+    
+    def capture(self, test):
+        """Run test with this thread's output buffered; returns (result, output)"""
+        self._local.buffer = buffer = io.StringIO()
+        try:
+            return test(), buffer.getvalue()
+        finally:
+            self._local.buffer = None
 
 def print_section(title):
     """Print formatted section header"""
-    print("\n" + "=" * 70)
+    print(f"\n{_BAR70}")
     print(f"  {title}")
-    print("=" * 70 + "\n")
+    print(f"{_BAR70}\n")
 
 def make_request(method, endpoint, **kwargs):
     """Make API request with optional API key"""
@@ -41,12 +83,16 @@ def test_health_check():
     return response.status_code == 200
 
 def test_session_list():
-    """Test 2: List existing sessions"""
+    """Test 2: List existing sessions
+
+    Returns (passed, payload) so callers can reuse the session list.
+    """
     print_section("Test 2: List Existing Sessions")
     
     response = make_request('GET', '/api/sessions')
     print(f"Status: {response.status_code}")
     
+    data = {}
     if response.status_code == 200:
         data = response.json()
         print(f"Total sessions: {data['total']}")
@@ -63,7 +109,7 @@ def test_session_list():
     else:
         print(f"Error: {response.text}")
     
-    return response.status_code == 200
+    return response.status_code == 200, data
 
 def test_storage_stats():
     """Test 3: Get storage statistics"""
@@ -104,6 +150,62 @@ def test_session_info(session_id):
     
     return response.status_code == 200
 
+def _print_leaderboard_summary(data):
+    """Print totals, weights and statistics of a leaderboard response"""
+    block = (f"\nTotal candidates: {data['total_candidates']}\n"
+             f"Weights - LinkedIn: {data['weights']['linkedin']}, GitHub: {data['weights']['github']}\n")
+    
+    if data.get('statistics'):
+        stats = data['statistics']
+        block += (f"\nStatistics:\n"
+                  f"  Mean: {stats['mean']:.4f}\n"
+                  f"  Median: {stats['median']:.4f}\n"
+                  f"  Range: {stats['min']:.4f} - {stats['max']:.4f}\n")
+    
+    sys.stdout.write(block)
+
+def _print_leaderboard_table_header(title):
+    """Print the leaderboard table title and column headings"""
+    sys.stdout.write(f"\n{title}:\n"
+                     f"{'Rank':<6} {'Name':<25} {'Combined':<10} {'LinkedIn':<10} {'GitHub':<10} {'Tier':<20}\n"
+                     f"{_DASH90}\n")
+
+def _format_candidate_row(candidate):
+    """Format one leaderboard table row"""
+    return (f"{candidate['rank']:<6} "
+            f"{candidate['name']:<25.24} "
+            f"{candidate['combined_score']:.4f}    "
+            f"{candidate['linkedin_score']:.4f}    "
+            f"{candidate['github_score']:.4f}    "
+            f"{candidate['emoji']} {candidate['tier']}")
+
+def _stream_leaderboard(response):
+    """
+    Format leaderboard rows as they are decoded from a streamed response
+    
+    Only the formatted rows are kept, never the decoded candidates. Returns
+    (rows, remaining top-level fields: totals, weights, statistics). The
+    server sorts keys, so those fields arrive after the leaderboard array.
+    """
+    response.raw.decode_content = True
+    summary = ijson.ObjectBuilder()
+    rows = []
+    row = None
+    
+    for prefix, event, value in ijson.parse(response.raw, use_float=True):
+        if prefix == 'leaderboard.item' and event == 'start_map':
+            row = ijson.ObjectBuilder()
+        
+        if row is not None:
+            row.event(event, value)
+            if prefix == 'leaderboard.item' and event == 'end_map':
+                rows.append(_format_candidate_row(row.value))
+                row = None
+        elif prefix != 'leaderboard' and not prefix.startswith('leaderboard.'):
+            summary.event(event, value)
+    
+    return rows, summary.value
+
 def test_get_leaderboard(session_id, linkedin_weight=0.5, github_weight=0.5, top_n=10):
     """Test 5: Get leaderboard for session"""
     print_section(f"Test 5: Get Leaderboard - {session_id}")
@@ -114,32 +216,25 @@ def test_get_leaderboard(session_id, linkedin_weight=0.5, github_weight=0.5, top
         'top_n': top_n
     }
     
-    response = make_request('GET', f'/api/leaderboard/{session_id}', params=params)
+    # Large leaderboards are decoded incrementally, without building the
+    # whole response as Python objects
+    stream = IJSON_AVAILABLE and top_n > STREAM_MIN_TOP_N
+    
+    response = make_request('GET', f'/api/leaderboard/{session_id}', params=params, stream=stream)
     print(f"Status: {response.status_code}")
     
     if response.status_code == 200:
-        data = response.json()
-        print(f"\nTotal candidates: {data['total_candidates']}")
-        print(f"Weights - LinkedIn: {data['weights']['linkedin']}, GitHub: {data['weights']['github']}")
-        
-        if data.get('statistics'):
-            stats = data['statistics']
-            print(f"\nStatistics:")
-            print(f"  Mean: {stats['mean']:.4f}")
-            print(f"  Median: {stats['median']:.4f}")
-            print(f"  Range: {stats['min']:.4f} - {stats['max']:.4f}")
-        
-        print(f"\nTop {len(data['leaderboard'])} Candidates:")
-        print(f"{'Rank':<6} {'Name':<25} {'Combined':<10} {'LinkedIn':<10} {'GitHub':<10} {'Tier':<20}")
-        print("-" * 90)
+        if stream:
+            rows, data = _stream_leaderboard(response)
+        else:
+            data = response.json()
+            rows = [_format_candidate_row(c) for c in data['leaderboard']]
+        _print_leaderboard_summary(data)
         
-        for candidate in data['leaderboard']:
-            print(f"{candidate['rank']:<6} "
-                  f"{candidate['name'][:24]:<25} "
-                  f"{candidate['combined_score']:.4f}    "
-                  f"{candidate['linkedin_score']:.4f}    "
-                  f"{candidate['github_score']:.4f}    "
-                  f"{candidate['emoji']} {candidate['tier']}")
+        # Both paths report the rows actually returned, which may be fewer than top_n
+        _print_leaderboard_table_header(f"Top {len(rows)} Candidates")
+        if rows:
+            sys.stdout.write("\n".join(rows) + "\n")
     else:
         print(f"Error: {response.text}")
     
@@ -170,26 +265,44 @@ def test_cleanup_dry_run():
     return response.status_code == 200
 
 def run_all_tests():
-    """Run all tests in sequence"""
-    print("\n" + "=" * 70)
+    """Run all tests (independent ones in parallel)"""
+    print(f"\n{_BAR70}")
     print("  DYNAMIC LEADERBOARD SYSTEM - TEST SUITE")
-    print("=" * 70)
+    print(_BAR70)
     
     results = []
     
-    # Test 1: Health check
-    results.append(("Health Check", test_health_check()))
-    
-    # Test 2: List sessions
-    results.append(("List Sessions", test_session_list()))
-    
-    # Test 3: Storage stats
-    results.append(("Storage Stats", test_storage_stats()))
+    # Tests 1-3 and 6 don't depend on each other, so run them concurrently
+    independent = [
+        ("Health Check", test_health_check),
+        ("List Sessions", test_session_list),
+        ("Storage Stats", test_storage_stats),
+        ("Cleanup Dry Run", test_cleanup_dry_run),
+    ]
+    # Each test's report is buffered and printed whole, in submission order
+    output = _ThreadOutput(sys.stdout)
+    sys.stdout = output
+    try:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [(name, executor.submit(output.capture, test)) for name, test in independent]
+            outcomes = []
+            for name, future in futures:
+                outcome, text = future.result()
+                output.stream.write(text)
+                outcomes.append((name, outcome))
+    finally:
+        sys.stdout = output.stream
+    
+    # test_session_list also hands back the payload it fetched
+    sessions_payload = {}
+    for name, outcome in outcomes:
+        if name == "List Sessions":
+            outcome, sessions_payload = outcome
+        results.append((name, outcome))
     
     # Get first session for testing (if exists)
-    response = make_request('GET', '/api/sessions')
-    if response.status_code == 200 and response.json()['sessions']:
-        session_id = response.json()['sessions'][0]['session_id']
+    if sessions_payload.get('sessions'):
+        session_id = sessions_payload['sessions'][0]['session_id']
         
         # Test 4: Session info
         results.append(("Session Info", test_session_info(session_id)))
@@ -207,9 +320,6 @@ def run_all_tests():
     else:
         print("\n⚠️  No sessions found. Upload resumes first using /api/rank-with-leaderboard")
     
-    # Test 6: Cleanup dry run
-    results.append(("Cleanup Dry Run", test_cleanup_dry_run()))
-    
     # Print summary
     print_section("TEST SUMMARY")
     
@@ -265,8 +375,6 @@ GET /api/leaderboard/{session_id}?linkedin_weight=0.5&github_weight=0.5&top_n=20
 """)
 
 if __name__ == '__main__':
-    import sys
-    
     if len(sys.argv) > 1:
         if sys.argv[1] == '--demo':
             demo_workflow()
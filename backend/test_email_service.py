@@ -11,37 +11,52 @@ from dotenv import load_dotenv
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(__file__))
 
-def test_configuration():
-    """Test if email service is properly configured"""
-    print("\n" + "="*70)
+# Banner rules, built once
+_BAR70 = "=" * 70
+_BAR68 = "=" * 68
+
+# Environment variables the email service needs
+_REQUIRED_VARS = ("SMTP_SERVER", "SMTP_PORT", "SMTP_EMAIL", "SMTP_PASSWORD", "SMTP_SENDER_NAME")
+
+def test_configuration(verbose=True):
+    """
+    Test if email service is properly configured
+    
+    With verbose=False nothing is printed and the check stops at the
+    first missing variable (used by --ci).
+    """
+    if not verbose:
+        load_dotenv()
+        for key in _REQUIRED_VARS:
+            if not os.getenv(key):
+                return False
+        return True
+    
+    print(f"\n{_BAR70}")
     print("📧 EMAIL SERVICE CONFIGURATION TEST")
-    print("="*70)
+    print(_BAR70)
     
     load_dotenv()
     
-    config_items = {
-        'SMTP_SERVER': os.getenv('SMTP_SERVER'),
-        'SMTP_PORT': os.getenv('SMTP_PORT'),
-        'SMTP_EMAIL': os.getenv('SMTP_EMAIL'),
-        'SMTP_PASSWORD': os.getenv('SMTP_PASSWORD', ''),
-        'SMTP_SENDER_NAME': os.getenv('SMTP_SENDER_NAME')
-    }
+    config_items = [
+        ('SMTP_SERVER', os.getenv('SMTP_SERVER')),
+        ('SMTP_PORT', os.getenv('SMTP_PORT')),
+        ('SMTP_EMAIL', os.getenv('SMTP_EMAIL')),
+        ('SMTP_PASSWORD', os.getenv('SMTP_PASSWORD', '')),
+        ('SMTP_SENDER_NAME', os.getenv('SMTP_SENDER_NAME'))
+    ]
     
     print("\n📋 Configuration Status:")
     all_configured = True
     
-    for key, value in config_items.items():
-        if key == 'SMTP_PASSWORD':
-            status = "✅ Set" if value else "❌ Not Set"
-            display_value = "*" * len(value[:4]) + "..." if value else "Not set"
-        else:
-            status = "✅ Set" if value else "❌ Not Set"
-            display_value = value if value else "Not set"
-        
-        print(f"  {key}: {display_value} - {status}")
-        
+    for key, value in config_items:
         if not value:
+            print(f"  {key}: Not set - ❌ Not Set")
             all_configured = False
+            continue
+        
+        display_value = ("*" * min(4, len(value)) + "...") if key == 'SMTP_PASSWORD' else value
+        print(f"  {key}: {display_value} - ✅ Set")
     
     if all_configured:
         print("\n✅ All configuration variables are set!")
@@ -55,9 +70,9 @@ def test_configuration():
 
 def test_import():
     """Test if email service module can be imported"""
-    print("\n" + "="*70)
+    print(f"\n{_BAR70}")
     print("📦 MODULE IMPORT TEST")
-    print("="*70)
+    print(_BAR70)
     
     try:
         from ibhanwork.emailsender import EmailService, EmailConfig, send_interview_invitations
@@ -73,9 +88,9 @@ def test_import():
 
 def test_email_config():
     """Test EmailConfig initialization"""
-    print("\n" + "="*70)
+    print(f"\n{_BAR70}")
     print("⚙️  EMAIL CONFIG INITIALIZATION TEST")
-    print("="*70)
+    print(_BAR70)
     
     try:
         from ibhanwork.emailsender import EmailConfig
@@ -103,9 +118,9 @@ def test_email_config():
 
 def test_smtp_connection():
     """Test SMTP connection"""
-    print("\n" + "="*70)
+    print(f"\n{_BAR70}")
     print("🔌 SMTP CONNECTION TEST")
-    print("="*70)
+    print(_BAR70)
     
     try:
         from ibhanwork.emailsender import EmailService
@@ -141,9 +156,9 @@ def test_smtp_connection():
 
 def test_email_generation():
     """Test email template generation"""
-    print("\n" + "="*70)
+    print(f"\n{_BAR70}")
     print("📝 EMAIL TEMPLATE GENERATION TEST")
-    print("="*70)
+    print(_BAR70)
     
     try:
         from ibhanwork.emailsender import EmailService
@@ -183,9 +198,9 @@ def test_email_generation():
 
 def test_send_single_email():
     """Test sending a single email (interactive)"""
-    print("\n" + "="*70)
+    print(f"\n{_BAR70}")
     print("📧 SINGLE EMAIL SEND TEST (Optional)")
-    print("="*70)
+    print(_BAR70)
     
     try:
         from ibhanwork.emailsender import EmailService
@@ -245,9 +260,9 @@ def test_send_single_email():
 def run_all_tests():
     """Run all tests"""
     print("\n")
-    print("╔" + "="*68 + "╗")
+    print(f"╔{_BAR68}╗")
     print("║" + " "*20 + "EMAIL SERVICE TEST SUITE" + " "*24 + "║")
-    print("╚" + "="*68 + "╝")
+    print(f"╚{_BAR68}╝")
     
     tests = [
         ("Configuration", test_configuration),
@@ -269,9 +284,9 @@ def run_all_tests():
             results.append((test_name, False))
     
     # Summary
-    print("\n" + "="*70)
+    print(f"\n{_BAR70}")
     print("📊 TEST SUMMARY")
-    print("="*70)
+    print(_BAR70)
     
     passed = sum(1 for _, result in results if result is True)
     failed = sum(1 for _, result in results if result is False)
@@ -294,8 +309,10 @@ def run_all_tests():
         print("\n⚠️  Some tests failed. Please review the errors above.")
         print("   Check EMAIL_SERVICE_GUIDE.md for troubleshooting help.")
     
-    print("\n" + "="*70 + "\n")
+    print(f"\n{_BAR70}\n")
 
 
 if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == '--ci':
+        sys.exit(0 if test_configuration(verbose=False) else 1)
     run_all_tests()
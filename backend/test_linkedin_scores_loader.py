@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Test Script for the Session results.csv Loader
+Checks that the vectorized loader agrees with DataLoader.load_linkedin_scores
+"""
+
+import io
+import os
+import sys
+import math
+import tempfile
+import contextlib
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'utils'))
+
+import dynamic_leaderboard
+from dynamic_leaderboard import _load_linkedin_scores
+from data_loader import DataLoader
+
+# These files are tiny; exercise the Arrow path anyway
+dynamic_leaderboard.PYARROW_CSV_MIN_BYTES = 0
+
+
+def _load_both(csv_text):
+    """Load csv_text with the session loader and with DataLoader"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'results.csv')
+        with open(path, 'w', encoding='utf-8', newline='') as f:
+            f.write(csv_text)
+
+        # DataLoader reports progress with print()
+        with contextlib.redirect_stdout(io.StringIO()):
+            expected = DataLoader(path, tmp).load_linkedin_scores()
+            loaded = _load_linkedin_scores(path)
+            if loaded is None:
+                loaded = DataLoader(path, tmp).load_linkedin_scores()
+    return loaded, expected
+
+
+def _assert_same(loaded, expected):
+    """Same names, same score types and values (NaN equal to NaN)"""
+    assert list(loaded) == list(expected), (loaded, expected)
+    for name, score in expected.items():
+        assert type(loaded[name]) is type(score), (name, loaded[name], score)
+        assert loaded[name] == score or (math.isnan(loaded[name]) and math.isnan(score))
+
+
+def test_clipped_integer_scores_are_floats():
+    """Integer scores outside 0-1 are clipped to floats"""
+    loaded, expected = _load_both("Candidate,Score\nAlice,2\nBob,-3\nCarol,1\n")
+    _assert_same(loaded, expected)
+    assert loaded == {'Alice': 1.0, 'Bob': 0.0, 'Carol': 1.0}
+
+
+def test_nan_scores_are_kept():
+    """'nan' is a float() value, so DataLoader keeps the row"""
+    loaded, expected = _load_both("Candidate,Score\nAlice,nan\nBob,0.5\nCarol,abc\n")
+    _assert_same(loaded, expected)
+    assert 'Alice' in loaded and 'Carol' not in loaded
+
+
+def test_row_with_extra_column():
+    """One ragged row doesn't zero the file"""
+    loaded, expected = _load_both("Candidate,Score\nAlice,0.5,extra\nBob,0.25\n")
+    _assert_same(loaded, expected)
+    assert loaded['Bob'] == 0.25
+
+
+def test_small_files_use_data_loader():
+    """Files under the size threshold are left to DataLoader"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'results.csv')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write("Candidate,Score\nAlice,0.5\n")
+        threshold = dynamic_leaderboard.PYARROW_CSV_MIN_BYTES
+        dynamic_leaderboard.PYARROW_CSV_MIN_BYTES = 64 * 1024
+        try:
+            assert _load_linkedin_scores(path) is None
+        finally:
+            dynamic_leaderboard.PYARROW_CSV_MIN_BYTES = threshold
+
+
+def test_inferable_strings_are_parsed_as_text():
+    """Values a CSV reader could type-infer ('0x1', '1_0') go through float()"""
+    loaded, expected = _load_both("Candidate,Score\nAlice,0x1\nBob,1_0\nCarol, 0.7 \n")
+    _assert_same(loaded, expected)
+
+
+if __name__ == '__main__':
+    tests = [
+        test_clipped_integer_scores_are_floats,
+        test_nan_scores_are_kept,
+        test_row_with_extra_column,
+        test_small_files_use_data_loader,
+        test_inferable_strings_are_parsed_as_text,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ {test.__name__}: {e}")
+    sys.exit(1 if failed else 0)
@@ -5,20 +5,46 @@ Utility modules for resume processing, scoring, and leaderboard generation
 
 __version__ = "1.0.0"
 
-# Core utilities
-from . import contact_extractor
-from . import resume_text_extractor
-from . import resume_scorer
-
-# Dynamic leaderboard system
-try:
-    from . import session_manager
-    from . import linkedin_score_generator
-    from . import github_analysis_generator
-    from . import dynamic_leaderboard
-    DYNAMIC_LEADERBOARD_AVAILABLE = True
-except ImportError as e:
-    DYNAMIC_LEADERBOARD_AVAILABLE = False
+import importlib
+
+# Submodules are imported on first attribute access (PEP 562) so that
+# importing one utility doesn't pull in the dependencies of all the others
+_LAZY = {
+    'contact_extractor',
+    'resume_text_extractor',
+    'resume_scorer',
+    'session_manager',
+    'linkedin_score_generator',
+    'github_analysis_generator',
+    'dynamic_leaderboard',
+}
+
+# Dynamic leaderboard system; DYNAMIC_LEADERBOARD_AVAILABLE is resolved on
+# first access by actually importing these
+_DYNAMIC_LEADERBOARD_MODULES = (
+    'session_manager',
+    'linkedin_score_generator',
+    'github_analysis_generator',
+    'dynamic_leaderboard',
+)
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        module = importlib.import_module(f'.{name}', __name__)
+        globals()[name] = module
+        return module
+    if name == 'DYNAMIC_LEADERBOARD_AVAILABLE':
+        try:
+            for module_name in _DYNAMIC_LEADERBOARD_MODULES:
+                __getattr__(module_name)
+            available = True
+        except ImportError:
+            available = False
+        globals()[name] = available
+        return available
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     'contact_extractor',
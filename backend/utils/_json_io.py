@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Shared JSON Writer
+Atomic JSON file writes used by SessionManager, GitHubAnalysisGenerator and
+DynamicLeaderboardGenerator, with orjson when it's installed
+"""
+
+import os
+import json
+import threading
+from typing import Any
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def json_default(value: Any) -> Any:
+    """Encode NumPy scalars and arrays (anything with tolist()) as plain Python values"""
+    if hasattr(value, 'tolist'):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps_json(obj: Any) -> bytes:
+    """
+    Serialize obj as indented UTF-8 JSON
+    
+    orjson is used when installed; anything it can't encode (e.g. ints
+    beyond 64 bits) goes through json instead. orjson writes NaN as null.
+    
+    Raises:
+        TypeError: If neither encoder can serialize obj
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(
+                obj,
+                default=json_default,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+            )
+        except TypeError:
+            pass
+    return json.dumps(obj, indent=2, default=json_default).encode('utf-8')
+
+
+def write_json_atomic(path: str, obj: Any) -> None:
+    """
+    Write obj to path as JSON atomically
+    
+    The JSON goes to a temporary file, unique per process and thread, that
+    is renamed over path, so readers never see a partially written file and
+    concurrent writers of the same path don't share a temp file.
+    
+    Args:
+        path: Destination path
+        obj: Object to serialize
+    """
+    data = dumps_json(obj)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+"""
+Shared Regex Patterns
+Contact, CGPA, experience and line patterns used by ContactExtractor,
+ComprehensiveResumeParser and ResumeScorer, compiled once at import
+"""
+
+import re
+
+
+EMAIL_RE = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+
+PHONE_RE = re.compile(r'(?:\+?\d{1,3}[-.\s]?)?(?:\(?\d{3}\)?[-.\s]?)?\d{3}[-.\s]?\d{4,6}')
+
+# Profile links; the named group captures the username
+GITHUB_RE = re.compile(r'(?:https?://)?(?:www\.)?github\.com/(?P<github>[a-zA-Z0-9_-]+)', re.IGNORECASE)
+
+LINKEDIN_RE = re.compile(r'(?:https?://)?(?:www\.)?linkedin\.com/in/(?P<linkedin>[a-zA-Z0-9_-]+)', re.IGNORECASE)
+
+# Full profile URLs, including any path after the domain
+GITHUB_URL_RE = re.compile(r'https?://(?:www\.)?github\.com/[a-zA-Z0-9_/.\-]+')
+
+LINKEDIN_URL_RE = re.compile(r'https?://(?:www\.)?linkedin\.com/[a-zA-Z0-9_/.\-]+')
+
+CGPA_RE = re.compile(r'(?:CGPA|GPA|Grade|Percentage)[:\s]*(?P<cgpa>[0-9]+\.?[0-9]*)\s*(?:/\s*10|/\s*4)?', re.IGNORECASE)
+
+EXPERIENCE_RE = re.compile(r'(?P<experience>\d+)\+?\s*(?:years?|yrs?)\s*(?:of\s*)?(?:experience|exp)', re.IGNORECASE)
+
+# Any non-blank line (captured without the padding)
+NONBLANK_LINE_RE = re.compile(r'^[^\S\n]*(\S(?:[^\n]*\S)?)', re.MULTILINE)
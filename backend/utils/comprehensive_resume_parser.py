@@ -12,42 +12,238 @@ Extracts ALL candidate information from resume text including:
 
 import re
 import os
+import copy
+import json
+import asyncio
+import hashlib
 import logging
-from typing import Dict, List, Optional, Any
+import functools
+import threading
+import importlib.util
+from collections import OrderedDict
+from typing import Dict, List, Optional, Any, Tuple
 from pathlib import Path
 
-# Try to import Google Generative AI for intelligent parsing
+# Try to import pyahocorasick for single-pass skill matching
 try:
-    import google.generativeai as genai
-    GENAI_AVAILABLE = True
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
 except ImportError:
-    GENAI_AVAILABLE = False
-    logging.warning("Google Generative AI not available. Using regex-based parsing only.")
+    AHOCORASICK_AVAILABLE = False
+
+# Try to import orjson for faster decoding of AI responses
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+try:
+    from ._regex_patterns import (
+        EMAIL_RE, PHONE_RE, GITHUB_RE, LINKEDIN_RE, CGPA_RE, EXPERIENCE_RE, NONBLANK_LINE_RE
+    )
+except ImportError:
+    from _regex_patterns import (
+        EMAIL_RE, PHONE_RE, GITHUB_RE, LINKEDIN_RE, CGPA_RE, EXPERIENCE_RE, NONBLANK_LINE_RE
+    )
 
 logger = logging.getLogger(__name__)
 
+# Regex patterns for fallback parsing, compiled once at import. Contact
+# details, CGPA and experience as (field, pattern, group holding the value).
+# Each is searched on its own: in a single fused alternation one field's
+# match can swallow text another field needs ("CGPA: 555-123-4567").
+_FIELD_RES = (
+    ('email', EMAIL_RE, 0),
+    ('phone', PHONE_RE, 0),
+    ('github', GITHUB_RE, 'github'),
+    ('linkedin', LINKEDIN_RE, 'linkedin'),
+    ('cgpa', CGPA_RE, 'cgpa'),
+    ('experience', EXPERIENCE_RE, 'experience'),
+)
+
+
+def _fuse(primary: str, fallback: str, flags: int = 0) -> Tuple[re.Pattern, re.Pattern]:
+    """Compile 'primary|fallback' for a single scan, plus primary alone"""
+    return re.compile(f'{primary}|{fallback}', flags), re.compile(primary, flags)
+
+
+def _search_in_order(patterns: Tuple[re.Pattern, re.Pattern], text: str) -> Optional[re.Match]:
+    """
+    Search with a fused pattern pair from _fuse()
+
+    Keeps the precedence of searching for the primary pattern first: if the
+    fallback alternative matched earlier in the text, a later primary match
+    still wins. Either way the capture groups end at match.lastindex.
+    """
+    fused, primary = patterns
+    match = fused.search(text)
+    if match and match.lastindex > primary.groups:
+        # The primary pattern can't match at or before match.start(), or the
+        # fused scan would have returned that
+        match = primary.search(text, match.start() + 1) or match
+    return match
+
+
+_LOCATION_RES = _fuse(
+    r'(?:Location|Address|Based in|City)[:\s]+([A-Z][a-zA-Z\s,]+(?:India|USA|UK|Canada|Singapore)?)',
+    r'([A-Z][a-z]+,\s*(?:India|USA|UK|Canada|Singapore))',
+    re.IGNORECASE
+)
+
+# Common degree patterns
+_DEGREE_RES = _fuse(
+    r'(B\.?Tech|Bachelor|M\.?Tech|Master|PhD|B\.?E\.?|M\.?E\.?)[\s\w]*(?:in)?\s*([\w\s]+)',
+    r'(Bachelor|Master)(?:\'s)?\s*(?:of)?\s*([\w\s]+)',
+    re.IGNORECASE
+)
+
+_UNI_RES = _fuse(
+    r'(?:from|at|@)\s*([A-Z][A-Za-z\s&,]+(?:University|Institute|College))',
+    r'([A-Z][A-Za-z\s&,]+(?:University|Institute|College|IIT|NIT))'
+)
+
+# Fields and rules shared by the single and batched Gemini prompts
+_AI_FIELDS = """{
+  "name": "Full name of the candidate",
+  "email": "Email address",
+  "phone": "Phone number",
+  "location": "City, Country or location mentioned",
+  "education": "Highest degree (e.g., B.Tech in Computer Science)",
+  "university": "University or college name",
+  "cgpa": "CGPA or GPA as a number (convert percentage to 10-point scale if needed)",
+  "experience_years": "Total years of experience as a number (extract from work history)",
+  "projects_count": "Number of projects mentioned (count them)",
+  "skills": ["List", "of", "technical", "skills"],
+  "github": "GitHub username (not full URL, just username)",
+  "linkedin": "LinkedIn profile username (not full URL, just username)",
+  "summary": "Brief 1-2 sentence professional summary"
+}"""
+
+_AI_RULES = """- If a field is not found, use empty string "" or empty array [] or 0 for numbers
+- For experience_years, count years from work history dates
+- For projects_count, count distinct projects mentioned
+- For skills, list ALL technical skills, frameworks, languages, tools mentioned
+- Extract ONLY the username from GitHub/LinkedIn URLs
+- For CGPA, convert percentages to 10-point scale (e.g., 85% = 8.5 CGPA)
+- Return ONLY valid JSON, no additional text"""
+
+# Gemini model used for AI parsing
+AI_MODEL_NAME = 'gemini-2.0-flash-exp'
+
+# Resumes packed into one Gemini request by parse_batch_with_ai
+AI_BATCH_SIZE = 8
+
+# Characters of each resume sent to Gemini
+AI_MAX_CHARS = 8000
+
+# Layout noise stripped before a resume is sent to Gemini: divider lines
+# and page footers, runs of spaces/tabs, and runs of blank lines
+_NOISE_RE = re.compile(r'^[ \t]*(?:[-=_*]{3,}|Page \d+ of \d+)[ \t]*\r?$', re.MULTILINE | re.IGNORECASE)
+_WS_RE = re.compile(r'[ \t]+')
+_BLANKS_RE = re.compile(r'\n(?:[ \t\r]*\n){2,}')
+
+
+def _compact_for_ai(text: str) -> str:
+    """Drop layout noise and redundant whitespace, then cut to AI_MAX_CHARS"""
+    text = _NOISE_RE.sub('', text)
+    text = _WS_RE.sub(' ', text)
+    text = _BLANKS_RE.sub('\n\n', text)
+    return text.strip()[:AI_MAX_CHARS]
+
+
+# Markdown code fence (```json ... ```) wrapped around an AI response
+_FENCE_RE = re.compile(r'^```(?:json)?\s*(.*?)\s*(?:```|$)', re.DOTALL)
+
+# A line of 2-4 whitespace-separated words (captured without the padding)
+_NAME_LINE_RE = re.compile(r'^[^\S\n]*(\S+(?:[^\S\n]+\S+){1,3})[^\S\n]*$', re.MULTILINE)
+
+# Lines containing any of these can't be the candidate's name
+_NAME_SKIP_RE = re.compile(r'email|@|phone|http|resume|cv|curriculum', re.IGNORECASE)
+
+# First line containing any of these starts the education section
+_EDUCATION_HEADER_RE = re.compile(r'education|academic|qualification|degree', re.IGNORECASE)
+
+# Common technical skills
+_COMMON_SKILLS = (
+    'Python', 'Java', 'JavaScript', 'C++', 'C#', 'Ruby', 'Go', 'Rust', 'Swift', 'Kotlin',
+    'React', 'Angular', 'Vue', 'Node.js', 'Express', 'Django', 'Flask', 'Spring',
+    'HTML', 'CSS', 'TypeScript', 'PHP', 'SQL', 'NoSQL',
+    'MongoDB', 'MySQL', 'PostgreSQL', 'Redis', 'Elasticsearch',
+    'Docker', 'Kubernetes', 'AWS', 'Azure', 'GCP', 'Jenkins', 'CI/CD',
+    'Git', 'GitHub', 'GitLab', 'Jira', 'Agile', 'Scrum',
+    'Machine Learning', 'Deep Learning', 'TensorFlow', 'PyTorch', 'Pandas', 'NumPy',
+    'RESTful', 'GraphQL', 'Microservices', 'API', 'OAuth',
+    'Linux', 'Unix', 'Bash', 'Shell',
+)
+
+# Limit to top 15 skills
+MAX_SKILLS = 15
+
+_COMMON_SKILLS_LOWER = tuple((skill, skill.lower()) for skill in _COMMON_SKILLS)
+
+
+def _build_skills_automaton():
+    """Build an Aho-Corasick automaton matching every skill in one pass"""
+    automaton = ahocorasick.Automaton()
+    for skill, skill_lower in _COMMON_SKILLS_LOWER:
+        automaton.add_word(skill_lower, skill)
+    automaton.make_automaton()
+    return automaton
+
+
+_SKILLS_AC = _build_skills_automaton() if AHOCORASICK_AVAILABLE else None
+
+_PROJECT_KW_RE = re.compile(r'\b(?:project|built|developed|created|implemented)\b', re.IGNORECASE)
+
+# Parsed results keyed by (produced by AI, content hash), shared by parsers
+# created with cache_results=True and evicted least-recently-used first
+PARSE_CACHE_SIZE = 256
+_PARSE_CACHE: 'OrderedDict[Tuple[bool, bytes], Dict[str, Any]]' = OrderedDict()
+_PARSE_CACHE_LOCK = threading.Lock()
+
+
+@functools.lru_cache(maxsize=None)
+def _genai_available() -> bool:
+    """Check for Google Generative AI without importing it (gRPC makes that slow)"""
+    try:
+        available = importlib.util.find_spec('google.generativeai') is not None
+    except ImportError:
+        available = False
+
+    if not available:
+        logging.warning("Google Generative AI not available. Using regex-based parsing only.")
+    return available
+
 
 class ComprehensiveResumeParser:
     """Extract comprehensive candidate information from resume text"""
 
-    def __init__(self, use_ai: bool = True):
+    # google.generativeai, imported by the first parser that needs it
+    _genai = None
+
+    def __init__(self, use_ai: bool = True, cache_results: bool = False):
         """
         Initialize the parser
 
         Args:
             use_ai: Whether to use AI-powered parsing (requires Gemini API key)
+            cache_results: Reuse results for resume text that was already parsed
+                (callers get a copy, so mutating it doesn't affect the cache)
         """
-        self.use_ai = use_ai and GENAI_AVAILABLE
+        self.use_ai = use_ai and _genai_available()
+        self.cache_results = cache_results
 
         # Initialize Gemini if available and API key is set
         if self.use_ai:
             api_key = os.getenv('GEMINI_API_KEY')
             if api_key:
                 try:
+                    genai = self._load_genai()
                     genai.configure(api_key=api_key)
                     # Use the latest Gemini 2.0 Flash model for best performance
-                    self.model = genai.GenerativeModel('gemini-2.0-flash-exp')
-                    logger.info("AI-powered parsing enabled with gemini-2.0-flash-exp")
+                    self.model = genai.GenerativeModel(AI_MODEL_NAME)
+                    logger.info(f"AI-powered parsing enabled with {AI_MODEL_NAME}")
                 except Exception as e:
                     logger.warning(f"Failed to initialize Gemini: {e}")
                     self.use_ai = False
@@ -55,13 +251,13 @@ class ComprehensiveResumeParser:
                 logger.info("No GEMINI_API_KEY found, using regex-based parsing")
                 self.use_ai = False
 
-        # Regex patterns for fallback parsing
-        self.email_pattern = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
-        self.phone_pattern = re.compile(r'(?:\+?\d{1,3}[-.\s]?)?(?:\(?\d{3}\)?[-.\s]?)?\d{3}[-.\s]?\d{4,6}')
-        self.github_pattern = re.compile(r'(?:https?://)?(?:www\.)?github\.com/([a-zA-Z0-9_-]+)', re.IGNORECASE)
-        self.linkedin_pattern = re.compile(r'(?:https?://)?(?:www\.)?linkedin\.com/in/([a-zA-Z0-9_-]+)', re.IGNORECASE)
-        self.cgpa_pattern = re.compile(r'(?:CGPA|GPA|Grade|Percentage)[:\s]*([0-9]+\.?[0-9]*)\s*(?:/\s*10|/\s*4)?', re.IGNORECASE)
-        self.experience_pattern = re.compile(r'(\d+)\+?\s*(?:years?|yrs?)\s*(?:of\s*)?(?:experience|exp)', re.IGNORECASE)
+    @classmethod
+    def _load_genai(cls):
+        """Import google.generativeai on first use and keep it on the class"""
+        if cls._genai is None:
+            import google.generativeai as genai
+            cls._genai = genai
+        return cls._genai
 
     def parse_with_ai(self, resume_text: str) -> Dict[str, Any]:
         """
@@ -79,48 +275,18 @@ class ComprehensiveResumeParser:
         prompt = f"""
 Extract ALL the following information from this resume. Return a JSON object with these exact fields:
 
-{{
-  "name": "Full name of the candidate",
-  "email": "Email address",
-  "phone": "Phone number",
-  "location": "City, Country or location mentioned",
-  "education": "Highest degree (e.g., B.Tech in Computer Science)",
-  "university": "University or college name",
-  "cgpa": "CGPA or GPA as a number (convert percentage to 10-point scale if needed)",
-  "experience_years": "Total years of experience as a number (extract from work history)",
-  "projects_count": "Number of projects mentioned (count them)",
-  "skills": ["List", "of", "technical", "skills"],
-  "github": "GitHub username (not full URL, just username)",
-  "linkedin": "LinkedIn profile username (not full URL, just username)",
-  "summary": "Brief 1-2 sentence professional summary"
-}}
+{_AI_FIELDS}
 
 Rules:
-- If a field is not found, use empty string "" or empty array [] or 0 for numbers
-- For experience_years, count years from work history dates
-- For projects_count, count distinct projects mentioned
-- For skills, list ALL technical skills, frameworks, languages, tools mentioned
-- Extract ONLY the username from GitHub/LinkedIn URLs
-- For CGPA, convert percentages to 10-point scale (e.g., 85% = 8.5 CGPA)
-- Return ONLY valid JSON, no additional text
+{_AI_RULES}
 
 Resume Text:
-{resume_text[:8000]}
+{_compact_for_ai(resume_text)}
 """
 
         try:
             response = self.model.generate_content(prompt)
-            result_text = response.text.strip()
-
-            # Clean up the response - remove markdown code blocks if present
-            if result_text.startswith('```'):
-                result_text = result_text.split('```')[1]
-                if result_text.startswith('json'):
-                    result_text = result_text[4:]
-                result_text = result_text.strip()
-
-            import json
-            parsed_data = json.loads(result_text)
+            parsed_data = self._load_ai_json(response.text)
 
             # Validate and clean the data
             return self._validate_parsed_data(parsed_data)
@@ -129,6 +295,79 @@ Resume Text:
             logger.error(f"AI parsing error: {e}")
             return None
 
+    def parse_batch_with_ai(self, resume_texts: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Use AI to extract information from several resumes at once
+
+        Resumes are packed AI_BATCH_SIZE to a request and the batches are
+        sent concurrently, so N resumes cost ceil(N / AI_BATCH_SIZE) round-trips.
+
+        Args:
+            resume_texts: Raw resume texts
+
+        Returns:
+            One dictionary per resume, in input order (None where parsing failed)
+        """
+        if not self.use_ai or not resume_texts:
+            return [None] * len(resume_texts)
+
+        batches = [
+            resume_texts[i:i + AI_BATCH_SIZE]
+            for i in range(0, len(resume_texts), AI_BATCH_SIZE)
+        ]
+
+        async def parse_all():
+            # The async client binds to the event loop it first runs on and
+            # asyncio.run() starts a new loop per call, so every run gets
+            # its own model instead of reusing self.model
+            model = self._load_genai().GenerativeModel(AI_MODEL_NAME)
+            return await asyncio.gather(*(self._parse_batch_async(model, batch) for batch in batches))
+
+        results = asyncio.run(parse_all())
+        return [parsed for batch_results in results for parsed in batch_results]
+
+    async def _parse_batch_async(self, model: Any, resume_texts: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """Parse one batch of resumes with a single Gemini request"""
+        resumes = "\n\n".join(
+            f"Resume {i}:\n{_compact_for_ai(text)}"
+            for i, text in enumerate(resume_texts, 1)
+        )
+
+        prompt = f"""
+Extract ALL the following information from each of the {len(resume_texts)} resumes below. Return a JSON object of the form {{"results": [...]}} with one object per resume, in the same order, each with these exact fields:
+
+{_AI_FIELDS}
+
+Rules:
+{_AI_RULES}
+
+{resumes}
+"""
+
+        try:
+            response = await model.generate_content_async(prompt)
+            items = self._load_ai_json(response.text).get('results', [])
+
+            if len(items) != len(resume_texts):
+                logger.error(f"AI batch parsing returned {len(items)} results for {len(resume_texts)} resumes")
+                return [None] * len(resume_texts)
+
+            return [self._validate_parsed_data(item) if isinstance(item, dict) else None for item in items]
+
+        except Exception as e:
+            logger.error(f"AI batch parsing error: {e}")
+            return [None] * len(resume_texts)
+
+    def _load_ai_json(self, result_text: str) -> Any:
+        """Decode a Gemini response, removing markdown code fences if present"""
+        result_text = result_text.strip()
+
+        fenced = _FENCE_RE.match(result_text)
+        if fenced:
+            result_text = fenced.group(1)
+
+        return _json_loads(result_text)
+
     def parse_with_regex(self, resume_text: str) -> Dict[str, Any]:
         """
         Fallback regex-based parsing
@@ -139,25 +378,27 @@ Resume Text:
         Returns:
             Dictionary with extracted fields
         """
-        # Extract basic info
-        emails = self.email_pattern.findall(resume_text)
-        phones = self.phone_pattern.findall(resume_text)
-        github_matches = self.github_pattern.findall(resume_text)
-        linkedin_matches = self.linkedin_pattern.findall(resume_text)
-        cgpa_matches = self.cgpa_pattern.findall(resume_text)
-        experience_matches = self.experience_pattern.findall(resume_text)
+        # Extract basic info (first match of each field)
+        first = {}
+        for field, pattern, group in _FIELD_RES:
+            match = pattern.search(resume_text)
+            if match:
+                first[field] = match.group(group)
+
+        # Split once for the line-oriented helpers
+        lines = resume_text.split('\n')
 
         # Extract name (first non-empty line that looks like a name)
-        name = self._extract_name_regex(resume_text)
+        name = self._extract_name_regex(lines)
 
         # Extract location
         location = self._extract_location_regex(resume_text)
 
         # Extract education
-        education_info = self._extract_education_regex(resume_text)
+        education_info = self._extract_education_regex(resume_text, lines)
 
         # Extract skills
-        skills = self._extract_skills_regex(resume_text)
+        skills = self._extract_skills_regex(resume_text, resume_text.lower())
 
         # Count projects
         projects_count = self._count_projects_regex(resume_text)
@@ -167,131 +408,93 @@ Resume Text:
 
         return {
             'name': name,
-            'email': emails[0] if emails else '',
-            'phone': phones[0] if phones else '',
+            'email': first.get('email', ''),
+            'phone': first.get('phone', ''),
             'location': location,
             'education': education_info.get('degree', ''),
             'university': education_info.get('university', ''),
-            'cgpa': float(cgpa_matches[0]) if cgpa_matches else 0.0,
-            'experience_years': int(experience_matches[0]) if experience_matches else 0,
+            'cgpa': float(first['cgpa']) if 'cgpa' in first else 0.0,
+            'experience_years': int(first['experience']) if 'experience' in first else 0,
             'projects_count': projects_count,
             'skills': skills,
-            'github': github_matches[0] if github_matches else '',
-            'linkedin': linkedin_matches[0] if linkedin_matches else '',
+            'github': first.get('github', ''),
+            'linkedin': first.get('linkedin', ''),
             'summary': summary
         }
 
-    def _extract_name_regex(self, text: str) -> str:
-        """Extract candidate name from resume"""
-        lines = [line.strip() for line in text.split('\n')[:10] if line.strip()]
+    def _extract_name_regex(self, lines: List[str]) -> str:
+        """Extract candidate name from the resume's lines"""
+        head = '\n'.join(lines[:10])
 
-        for line in lines:
-            # Skip lines with common keywords
-            if any(kw in line.lower() for kw in ['email', '@', 'phone', 'http', 'resume', 'cv', 'curriculum']):
+        # First line that looks like a name: 2-4 words, one capitalized,
+        # no digits or contact/heading keywords
+        for match in _NAME_LINE_RE.finditer(head):
+            line = match.group(1)
+            if _NAME_SKIP_RE.search(line):
                 continue
+            if any(w[0].isupper() for w in line.split()):
+                if not any(c.isdigit() for c in line):
+                    return line
 
-            # Check if line looks like a name (2-4 words, mostly capitalized)
-            words = line.split()
-            if 2 <= len(words) <= 4:
-                if any(w[0].isupper() for w in words if w):
-                    if not any(c.isdigit() for c in line):
-                        return line
-
-        return lines[0] if lines else 'Unknown Candidate'
+        first_line = NONBLANK_LINE_RE.search(head)
+        return first_line.group(1) if first_line else 'Unknown Candidate'
 
     def _extract_location_regex(self, text: str) -> str:
         """Extract location from resume"""
-        location_patterns = [
-            r'(?:Location|Address|Based in|City)[:\s]+([A-Z][a-zA-Z\s,]+(?:India|USA|UK|Canada|Singapore)?)',
-            r'([A-Z][a-z]+,\s*(?:India|USA|UK|Canada|Singapore))',
-        ]
+        match = _search_in_order(_LOCATION_RES, text)
+        return match.group(match.lastindex).strip() if match else ''
 
-        for pattern in location_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                return match.group(1).strip()
-
-        return ''
-
-    def _extract_education_regex(self, text: str) -> Dict[str, str]:
+    def _extract_education_regex(self, text: str, lines: Optional[List[str]] = None) -> Dict[str, str]:
         """Extract education information"""
-        education_keywords = ['education', 'academic', 'qualification', 'degree']
-
-        # Find education section
-        lines = text.split('\n')
-        edu_start = -1
+        # Find education section with a single scan of the whole text
+        header = _EDUCATION_HEADER_RE.search(text)
 
-        for i, line in enumerate(lines):
-            if any(kw in line.lower() for kw in education_keywords):
-                edu_start = i
-                break
-
-        if edu_start >= 0:
+        if header:
+            if lines is None:
+                lines = text.split('\n')
+            edu_start = text.count('\n', 0, header.start())
             edu_section = '\n'.join(lines[edu_start:edu_start+10])
 
-            # Common degree patterns
-            degree_patterns = [
-                r'(B\.?Tech|Bachelor|M\.?Tech|Master|PhD|B\.?E\.?|M\.?E\.?)[\s\w]*(?:in)?\s*([\w\s]+)',
-                r'(Bachelor|Master)(?:\'s)?\s*(?:of)?\s*([\w\s]+)',
-            ]
-
             degree = ''
             university = ''
 
-            for pattern in degree_patterns:
-                match = re.search(pattern, edu_section, re.IGNORECASE)
-                if match:
-                    degree = f"{match.group(1)} in {match.group(2).strip()}"
-                    break
+            match = _search_in_order(_DEGREE_RES, edu_section)
+            if match:
+                level, field = match.group(match.lastindex - 1, match.lastindex)
+                degree = f"{level} in {field.strip()}"
 
             # Extract university
-            uni_patterns = [
-                r'(?:from|at|@)\s*([A-Z][A-Za-z\s&,]+(?:University|Institute|College))',
-                r'([A-Z][A-Za-z\s&,]+(?:University|Institute|College|IIT|NIT))',
-            ]
-
-            for pattern in uni_patterns:
-                match = re.search(pattern, edu_section)
-                if match:
-                    university = match.group(1).strip()
-                    break
+            match = _search_in_order(_UNI_RES, edu_section)
+            if match:
+                university = match.group(match.lastindex).strip()
 
             return {'degree': degree, 'university': university}
 
         return {'degree': '', 'university': ''}
 
-    def _extract_skills_regex(self, text: str) -> List[str]:
-        """Extract technical skills"""
-        # Common technical skills
-        common_skills = [
-            'Python', 'Java', 'JavaScript', 'C++', 'C#', 'Ruby', 'Go', 'Rust', 'Swift', 'Kotlin',
-            'React', 'Angular', 'Vue', 'Node.js', 'Express', 'Django', 'Flask', 'Spring',
-            'HTML', 'CSS', 'TypeScript', 'PHP', 'SQL', 'NoSQL',
-            'MongoDB', 'MySQL', 'PostgreSQL', 'Redis', 'Elasticsearch',
-            'Docker', 'Kubernetes', 'AWS', 'Azure', 'GCP', 'Jenkins', 'CI/CD',
-            'Git', 'GitHub', 'GitLab', 'Jira', 'Agile', 'Scrum',
-            'Machine Learning', 'Deep Learning', 'TensorFlow', 'PyTorch', 'Pandas', 'NumPy',
-            'RESTful', 'GraphQL', 'Microservices', 'API', 'OAuth',
-            'Linux', 'Unix', 'Bash', 'Shell',
-        ]
-
-        found_skills = []
-        text_lower = text.lower()
-
-        for skill in common_skills:
-            if skill.lower() in text_lower:
-                found_skills.append(skill)
-
-        return found_skills[:15]  # Limit to top 15 skills
+    def _extract_skills_regex(self, text: str, text_lower: Optional[str] = None) -> List[str]:
+        """Extract technical skills (pass text_lower if the caller already has it)"""
+        if text_lower is None:
+            text_lower = text.lower()
+
+        if _SKILLS_AC is not None:
+            matched = {skill for _, skill in _SKILLS_AC.iter(text_lower)}
+            found_skills = [skill for skill in _COMMON_SKILLS if skill in matched]
+        else:
+            # Skills are reported in list order, so stop once the limit is reached
+            found_skills = []
+            for skill, skill_lower in _COMMON_SKILLS_LOWER:
+                if skill_lower in text_lower:
+                    found_skills.append(skill)
+                    if len(found_skills) == MAX_SKILLS:
+                        break
+
+        return found_skills[:MAX_SKILLS]
 
     def _count_projects_regex(self, text: str) -> int:
         """Count projects mentioned in resume"""
-        project_keywords = ['project', 'built', 'developed', 'created', 'implemented']
-
         # Simple heuristic: count occurrences of project-related keywords
-        count = 0
-        for keyword in project_keywords:
-            count += len(re.findall(rf'\b{keyword}\b', text, re.IGNORECASE))
+        count = sum(1 for _ in _PROJECT_KW_RE.finditer(text))
 
         # Estimate project count (very rough approximation)
         estimated_projects = min(count // 2, 20)  # Cap at 20
@@ -376,19 +579,85 @@ Resume Text:
         if not resume_text or not resume_text.strip():
             return self._validate_parsed_data({})
 
+        if not self.cache_results:
+            return self._parse_text(resume_text)[0]
+
+        # Only a result from the parser this instance prefers is reused: after
+        # a failed AI call the regex fallback is cached under the regex key,
+        # so the next parse retries the AI
+        digest = hashlib.blake2b(resume_text.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+        with _PARSE_CACHE_LOCK:
+            cached = _PARSE_CACHE.get((self.use_ai, digest))
+            if cached is not None:
+                _PARSE_CACHE.move_to_end((self.use_ai, digest))
+        if cached is not None:
+            return copy.deepcopy(cached)
+
+        result, from_ai = self._parse_text(resume_text)
+        with _PARSE_CACHE_LOCK:
+            _PARSE_CACHE[(from_ai, digest)] = copy.deepcopy(result)
+            if len(_PARSE_CACHE) > PARSE_CACHE_SIZE:
+                _PARSE_CACHE.popitem(last=False)
+        return result
+
+    def _parse_text(self, resume_text: str) -> Tuple[Dict[str, Any], bool]:
+        """
+        Parse non-empty resume text with AI, falling back to regex
+
+        Returns:
+            tuple: (parsed data, whether it came from the AI)
+        """
         # Try AI parsing first
         if self.use_ai:
             try:
                 ai_result = self.parse_with_ai(resume_text)
                 if ai_result:
                     logger.info("Successfully parsed resume with AI")
-                    return ai_result
+                    return ai_result, True
             except Exception as e:
                 logger.warning(f"AI parsing failed, falling back to regex: {e}")
 
         # Fallback to regex parsing
         logger.info("Using regex-based parsing")
-        return self.parse_with_regex(resume_text)
+        return self.parse_with_regex(resume_text), False
+
+    def parse_many(self, resume_texts: List[str]) -> List[Dict[str, Any]]:
+        """
+        Parse several resumes, batching the AI requests
+
+        Args:
+            resume_texts: Raw resume texts
+
+        Returns:
+            One dictionary per resume, in input order
+        """
+        results = [None] * len(resume_texts)
+        pending = [i for i, text in enumerate(resume_texts) if text and text.strip()]
+        pending_set = set(pending)
+
+        if self.use_ai and pending:
+            ai_results = self.parse_batch_with_ai([resume_texts[i] for i in pending])
+            for i, ai_result in zip(pending, ai_results):
+                results[i] = ai_result
+            logger.info(f"Parsed {sum(r is not None for r in results)}/{len(pending)} resumes with AI")
+
+        # Fall back to regex parsing for anything AI didn't handle
+        for i, text in enumerate(resume_texts):
+            if results[i] is None:
+                results[i] = self.parse_with_regex(text) if i in pending_set else self._validate_parsed_data({})
+
+        return results
+
+
+@functools.lru_cache(maxsize=2)
+def _get_parser(use_ai: bool) -> ComprehensiveResumeParser:
+    """
+    Return a shared parser so the Gemini client is configured once per process
+
+    Its results are cached, so a resume parsed again (preview, then final
+    scoring) doesn't repeat the Gemini call or regex pass.
+    """
+    return ComprehensiveResumeParser(use_ai=use_ai, cache_results=True)
 
 
 def parse_comprehensive_resume(resume_text: str, use_ai: bool = True) -> Dict[str, Any]:
@@ -402,8 +671,21 @@ def parse_comprehensive_resume(resume_text: str, use_ai: bool = True) -> Dict[st
     Returns:
         Dictionary with all extracted information
     """
-    parser = ComprehensiveResumeParser(use_ai=use_ai)
-    return parser.parse(resume_text)
+    return _get_parser(use_ai).parse(resume_text)
+
+
+def parse_comprehensive_resumes(resume_texts: List[str], use_ai: bool = True) -> List[Dict[str, Any]]:
+    """
+    Convenience function to parse many resumes comprehensively
+
+    Args:
+        resume_texts: Raw resume texts
+        use_ai: Whether to use AI-powered parsing
+
+    Returns:
+        List of dictionaries with all extracted information, in input order
+    """
+    return _get_parser(use_ai).parse_many(resume_texts)
 
 
 if __name__ == '__main__':
@@ -436,5 +718,4 @@ if __name__ == '__main__':
 
     result = parse_comprehensive_resume(sample_resume)
 
-    import json
     print(json.dumps(result, indent=2))
@@ -5,20 +5,27 @@ Extracts emails, phone numbers, LinkedIn and GitHub URLs from text
 Converted from Colab script to standalone utility
 """
 
-import re
 from typing import Dict, List, Optional
 
 
+try:
+    from ._regex_patterns import EMAIL_RE, PHONE_RE, GITHUB_URL_RE, LINKEDIN_URL_RE
+except ImportError:
+    from _regex_patterns import EMAIL_RE, PHONE_RE, GITHUB_URL_RE, LINKEDIN_URL_RE
+
+
+# Result key -> pattern; each is scanned on its own so overlapping matches
+# (a phone number inside an email address) are all reported
+_CONTACT_RES = (
+    ('emails', EMAIL_RE),
+    ('phones', PHONE_RE),
+    ('linkedin', LINKEDIN_URL_RE),
+    ('github', GITHUB_URL_RE),
+)
+
 class ContactExtractor:
     """Extract contact information from resume text"""
     
-    def __init__(self):
-        """Initialize regex patterns"""
-        self.email_pattern = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
-        self.phone_pattern = re.compile(r'(?:(?:\+?\d{1,3}[-.\s]?)?(?:\(?\d{3}\)?[-.\s]?)?\d{3}[-.\s]?\d{4,6})')
-        self.linkedin_pattern = re.compile(r'(https?://(www\.)?linkedin\.com/[a-zA-Z0-9_/.\-]+)')
-        self.github_pattern = re.compile(r'(https?://(www\.)?github\.com/[a-zA-Z0-9_/.\-]+)')
-    
     def extract_from_text(self, text: str) -> Dict[str, List[str]]:
         """
         Extract all contact information from text
@@ -30,16 +37,9 @@ class ContactExtractor:
             Dictionary with emails, phones, linkedin, github URLs
         """
         # Extract and deduplicate while preserving order
-        emails = list(dict.fromkeys(self.email_pattern.findall(text)))
-        phones = list(dict.fromkeys(self.phone_pattern.findall(text)))
-        linkedins = list(dict.fromkeys([match[0] for match in self.linkedin_pattern.findall(text)]))
-        githubs = list(dict.fromkeys([match[0] for match in self.github_pattern.findall(text)]))
-        
         return {
-            'emails': emails,
-            'phones': phones,
-            'linkedin': linkedins,
-            'github': githubs
+            key: list(dict.fromkeys(pattern.findall(text)))
+            for key, pattern in _CONTACT_RES
         }
     
     def extract_from_file(self, file_path: str) -> Dict[str, List[str]]:
@@ -66,6 +66,9 @@ class ContactExtractor:
             }
 
 
+_DEFAULT_EXTRACTOR = ContactExtractor()
+
+
 def extract_contacts(text: str) -> Dict[str, List[str]]:
     """
     Convenience function to extract contacts from text
@@ -76,8 +79,7 @@ def extract_contacts(text: str) -> Dict[str, List[str]]:
     Returns:
         Dictionary with contact information
     """
-    extractor = ContactExtractor()
-    return extractor.extract_from_text(text)
+    return _DEFAULT_EXTRACTOR.extract_from_text(text)
 
 
 if __name__ == '__main__':
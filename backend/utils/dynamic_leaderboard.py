@@ -8,25 +8,294 @@ Wrapper around the existing leaderboard system
 import os
 import sys
 import json
+import codecs
 import logging
-from typing import Dict, List, Any, Optional
-from dataclasses import asdict
+import functools
+from typing import Dict, List, Any, Optional, Tuple
+from dataclasses import fields
+
+import numpy as np
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    from ._json_io import write_json_atomic
+except ImportError:
+    from _json_io import write_json_atomic
 
 logger = logging.getLogger(__name__)
 
+# Below this many scores plain Python beats NumPy's array setup cost
+NUMPY_STATS_THRESHOLD = 64
+
+# results.csv files smaller than this are read by DataLoader; csv.DictReader
+# wins on small files, and Arrow's import alone costs ~90ms
+PYARROW_CSV_MIN_BYTES = 64 * 1024
+
+# Arrow's multithreaded CSV reader (pyarrow, pyarrow.compute, pyarrow.csv);
+# None until first use, False if the import failed. It rejects ragged rows
+# instead of padding or truncating them, so those files can be handed to
+# DataLoader's csv.DictReader path unchanged.
+_PYARROW = None
+
 # Add leaderboard directory to path
 LEADERBOARD_DIR = os.path.join(os.path.dirname(__file__), '..', 'leaderboard')
 sys.path.insert(0, LEADERBOARD_DIR)
 
 try:
     from data_loader import DataLoader
-    from leaderboard import LeaderboardGenerator
+    from leaderboard import LeaderboardGenerator, RankedCandidate
+    # leaderboard/utils.py, resolved exactly as data_loader resolves it
+    from utils import normalize_github_score
     LEADERBOARD_AVAILABLE = True
+    
+    # RankedCandidate is flat, so a field-by-field copy matches asdict()
+    # without its recursive deep copy
+    _CANDIDATE_FIELDS = tuple(field.name for field in fields(RankedCandidate))
 except ImportError as e:
     logger.error(f"Failed to import leaderboard modules: {e}")
     LEADERBOARD_AVAILABLE = False
 
 
+def _load_pyarrow():
+    """Import pyarrow on first use"""
+    global _PYARROW
+    if _PYARROW is None:
+        try:
+            import pyarrow
+            import pyarrow.compute
+            import pyarrow.csv
+            _PYARROW = (pyarrow, pyarrow.compute, pyarrow.csv)
+        except ImportError:
+            _PYARROW = False
+    return _PYARROW
+
+
+def _parse_score(value: str) -> Optional[float]:
+    """float() a score string, or None if it isn't a number"""
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def _load_linkedin_scores(linkedin_path: str) -> Optional[Dict[str, float]]:
+    """
+    Load a session's results.csv in one vectorized pass
+    
+    Mirrors DataLoader.load_linkedin_scores: names are stripped, rows with
+    an empty name or a score float() rejects are skipped, scores are clipped
+    to 0-1 and a repeated name keeps its last score.
+    
+    Args:
+        linkedin_path: Path to results.csv
+        
+    Returns:
+        dict: Candidate name -> normalized LinkedIn score, or None when the
+        file is small, pyarrow is missing or the file is malformed (ragged
+        rows, bad encoding) and DataLoader's row-by-row reader should be
+        used instead
+    """
+    with open(linkedin_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size < PYARROW_CSV_MIN_BYTES:
+            return None
+        head = f.read(len(codecs.BOM_UTF8))
+    if head == codecs.BOM_UTF8:
+        # Arrow strips the BOM, DictReader keeps it in the first header name
+        return None
+    
+    arrow = _load_pyarrow()
+    if not arrow:
+        return None
+    pa, pa_compute, pa_csv = arrow
+    
+    # Read both columns as plain strings: letting Arrow infer types would
+    # turn '1' into True or '0x1' into 1 before float() ever sees them
+    try:
+        table = pa_csv.read_csv(
+            linkedin_path,
+            parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+            convert_options=pa_csv.ConvertOptions(
+                column_types={'Candidate': pa.string(), 'Score': pa.string()},
+                strings_can_be_null=False
+            )
+        )
+        header = table.column_names
+    except Exception as e:
+        logger.debug(f"Vectorized read of {linkedin_path} failed, using DataLoader: {e}")
+        return None
+    
+    if header.count('Candidate') > 1 or header.count('Score') > 1:
+        # DictReader lets the last duplicate column win
+        return None
+    if 'Candidate' not in header or len(table) == 0:
+        return {}
+    
+    # utf8_trim_whitespace strips exactly the characters str.strip() does
+    names = pa_compute.utf8_trim_whitespace(table.column('Candidate')).to_numpy(zero_copy_only=False)
+    named = names != ''
+    names = names[named]
+    
+    if 'Score' in header:
+        raw_scores = table.column('Score').to_numpy(zero_copy_only=False)[named]
+    else:
+        raw_scores = np.full(len(names), '0', dtype=object)
+    
+    # An object -> float cast calls float() on every cell in C, so it accepts
+    # exactly what DataLoader does; only files with a bad score pay for the
+    # per-row pass that finds and skips them
+    try:
+        scores = raw_scores.astype(float)
+    except ValueError:
+        parsed = [_parse_score(value) for value in raw_scores]
+        valid = np.array([score is not None for score in parsed], dtype=bool)
+        logger.warning(f"Skipped {int((~valid).sum())} rows with invalid scores in {linkedin_path}")
+        names = names[valid]
+        scores = np.array([score for score in parsed if score is not None], dtype=float)
+    
+    return dict(zip(names.tolist(), np.clip(scores, 0.0, 1.0).tolist()))
+
+
+def _load_github_scores(github_path: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Load a session's GitHub analysis reports
+    
+    Same results as DataLoader.load_github_scores, but lists the directory
+    with os.scandir (skipping non-files without another stat) and decodes
+    reports with orjson when it's installed.
+    
+    Args:
+        github_path: Path to the reports directory
+        
+    Returns:
+        dict: GitHub username -> score data
+    """
+    scores = {}
+    
+    with os.scandir(github_path) as entries:
+        report_entries = [
+            (entry.name, entry.path) for entry in entries
+            if entry.name.startswith('analysis_') and entry.name.endswith('.json') and entry.is_file()
+        ]
+    
+    if not report_entries:
+        logger.warning(f"No GitHub analysis files found in: {github_path}")
+        return scores
+    
+    for filename, path in report_entries:
+        try:
+            with open(path, 'rb') as f:
+                raw = f.read()
+            try:
+                data = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw.decode('utf-8'))
+            except ValueError:
+                # orjson is stricter than json (e.g. NaN); let json decide
+                data = json.loads(raw.decode('utf-8'))
+            
+            # Username comes from the filename (analysis_USERNAME.json)
+            username = filename.replace('analysis_', '').replace('.json', '')
+            
+            overall_score = data.get('match_results', {}).get('overall_score', 0)
+            name = data.get('analysis', {}).get('profile', {}).get('name') or username
+            
+            scores[username] = {
+                'name': name,
+                'score': normalize_github_score(overall_score),
+                'raw_score': overall_score,
+                'username': username
+            }
+        except Exception as e:
+            logger.warning(f"Error loading {path}: {e}")
+    
+    logger.info(f"Loaded {len(scores)} GitHub scores")
+    return scores
+
+
+def _session_data_version(linkedin_path: str, github_path: str) -> Tuple:
+    """
+    (mtime_ns, size) of a session's score files, as a hashable cache key
+    
+    Sizes are included so a rewrite that keeps the timestamp (coarse
+    filesystem clocks, copies that preserve mtimes) still changes the key.
+    Only analysis_*.json reports count: the atomic writer's temp files come
+    and go while a report is being written.
+    """
+    linkedin_st = os.stat(linkedin_path)
+    reports = []
+    with os.scandir(github_path) as entries:
+        for entry in entries:
+            if not (entry.name.startswith('analysis_') and entry.name.endswith('.json')):
+                continue
+            try:
+                st = entry.stat()
+            except OSError:
+                # Renamed or removed since the listing
+                continue
+            reports.append((entry.name, st.st_mtime_ns, st.st_size))
+    reports.sort()
+    return (linkedin_st.st_mtime_ns, linkedin_st.st_size), tuple(reports)
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_generate(
+    session_dir: str,
+    linkedin_weight: float,
+    github_weight: float,
+    min_score: float,
+    version: Tuple
+):
+    """
+    Load and rank every candidate in a session
+    
+    version only takes part in the cache key, so cached rankings are dropped
+    as soon as results.csv or any GitHub report changes.
+    
+    Returns:
+        tuple: (ranked candidate dicts, {lowercase name: candidate dict}),
+        or None if the session has no candidates
+    """
+    linkedin_path = os.path.join(session_dir, 'results.csv')
+    github_path = os.path.join(session_dir, 'reports')
+    
+    logger.info(f"Loading data from session: {session_dir}")
+    data_loader = DataLoader(linkedin_path, github_path)
+    linkedin_scores = _load_linkedin_scores(linkedin_path)
+    if linkedin_scores is None:
+        linkedin_scores = data_loader.load_linkedin_scores()
+    candidates = data_loader.merge_candidate_data(
+        linkedin_scores,
+        _load_github_scores(github_path)
+    )
+    
+    if not candidates:
+        return None
+    
+    logger.info(f"Loaded {len(candidates)} candidates")
+    
+    lb_generator = LeaderboardGenerator(
+        candidates,
+        linkedin_weight=linkedin_weight,
+        github_weight=github_weight,
+        min_score=min_score
+    )
+    
+    # Convert to dictionaries for JSON serialization
+    ranked = tuple([
+        {name: getattr(candidate, name) for name in _CANDIDATE_FIELDS}
+        for candidate in lb_generator.calculate_scores()
+    ])
+    
+    by_name = {}
+    for candidate in ranked:
+        by_name.setdefault(candidate['name'].lower(), candidate)
+    
+    return ranked, by_name
+
+
 class DynamicLeaderboardGenerator:
     """
     Generates leaderboards from session-specific data files
@@ -63,32 +332,18 @@ class DynamicLeaderboardGenerator:
             ValueError: If session directory doesn't exist or data files missing
             FileNotFoundError: If required files not found
         """
-        # Validate session directory
-        if not os.path.exists(session_dir):
-            raise ValueError(f"Session directory not found: {session_dir}")
-        
-        # Define paths
-        linkedin_path = os.path.join(session_dir, 'results.csv')
-        github_path = os.path.join(session_dir, 'reports')
-        
-        # Check if results.csv exists
-        if not os.path.exists(linkedin_path):
-            logger.warning(f"LinkedIn results not found: {linkedin_path}")
-            # Create empty results.csv
-            self._create_empty_results_csv(linkedin_path)
-        
-        # Check if reports directory exists
-        if not os.path.exists(github_path):
-            logger.warning(f"GitHub reports directory not found: {github_path}")
-            os.makedirs(github_path, exist_ok=True)
+        linkedin_path, github_path = self._prepare_session(session_dir)
         
         try:
-            # Load data
-            logger.info(f"Loading data from session: {session_dir}")
-            data_loader = DataLoader(linkedin_path, github_path)
-            candidates = data_loader.load_all_data()
+            ranking = _cached_generate(
+                session_dir,
+                linkedin_weight,
+                github_weight,
+                min_score,
+                _session_data_version(linkedin_path, github_path)
+            )
             
-            if not candidates:
+            if ranking is None:
                 logger.warning("No candidates found in session data")
                 return {
                     'success': True,
@@ -101,29 +356,13 @@ class DynamicLeaderboardGenerator:
                     }
                 }
             
-            logger.info(f"Loaded {len(candidates)} candidates")
-            
-            # Generate leaderboard
-            lb_generator = LeaderboardGenerator(
-                candidates,
-                linkedin_weight=linkedin_weight,
-                github_weight=github_weight,
-                min_score=min_score
-            )
-            
-            ranked_candidates = lb_generator.calculate_scores()
+            ranked_candidates, _ = ranking
             
-            # Get top N candidates
-            top_candidates = lb_generator.get_top_candidates(top_n)
-            
-            # Convert to dictionaries for JSON serialization
-            leaderboard_data = []
-            for candidate in top_candidates:
-                candidate_dict = asdict(candidate)
-                leaderboard_data.append(candidate_dict)
+            # Get top N candidates (copied so callers can't alter the cache)
+            leaderboard_data = [dict(candidate) for candidate in ranked_candidates[:top_n]]
             
             # Calculate statistics
-            all_scores = [c.combined_score for c in ranked_candidates]
+            all_scores = [c['combined_score'] for c in ranked_candidates]
             stats = self._calculate_statistics(all_scores)
             
             # Build result
@@ -171,24 +410,60 @@ class DynamicLeaderboardGenerator:
             dict: Candidate details with rank, or None if not found
         """
         try:
-            leaderboard = self.generate_leaderboard(
+            linkedin_path, github_path = self._prepare_session(session_dir)
+            ranking = _cached_generate(
                 session_dir,
-                linkedin_weight=linkedin_weight,
-                github_weight=github_weight,
-                top_n=9999  # Get all candidates
+                linkedin_weight,
+                github_weight,
+                0.0,
+                _session_data_version(linkedin_path, github_path)
             )
             
-            # Search for candidate
-            for candidate in leaderboard['leaderboard']:
-                if candidate['name'].lower() == candidate_name.lower():
-                    return candidate
+            if ranking is None:
+                return None
             
-            return None
+            _, by_name = ranking
+            candidate = by_name.get(candidate_name.lower())
+            return dict(candidate) if candidate else None
             
         except Exception as e:
             logger.error(f"Error getting candidate rank: {e}")
             return None
     
+    def _prepare_session(self, session_dir: str) -> Tuple[str, str]:
+        """
+        Resolve a session's data paths, creating empty ones where missing
+        
+        Args:
+            session_dir: Path to session directory
+            
+        Returns:
+            tuple: (results.csv path, reports directory path)
+            
+        Raises:
+            ValueError: If session directory doesn't exist
+        """
+        # Validate session directory
+        if not os.path.exists(session_dir):
+            raise ValueError(f"Session directory not found: {session_dir}")
+        
+        # Define paths
+        linkedin_path = os.path.join(session_dir, 'results.csv')
+        github_path = os.path.join(session_dir, 'reports')
+        
+        # Check if results.csv exists
+        if not os.path.exists(linkedin_path):
+            logger.warning(f"LinkedIn results not found: {linkedin_path}")
+            # Create empty results.csv
+            self._create_empty_results_csv(linkedin_path)
+        
+        # Check if reports directory exists
+        if not os.path.exists(github_path):
+            logger.warning(f"GitHub reports directory not found: {github_path}")
+            os.makedirs(github_path, exist_ok=True)
+        
+        return linkedin_path, github_path
+    
     def _calculate_statistics(self, scores: List[float]) -> Dict[str, Any]:
         """
         Calculate statistics for leaderboard scores
@@ -208,8 +483,19 @@ class DynamicLeaderboardGenerator:
                 'count': 0
             }
         
+        n = len(scores)
+        
+        if n >= NUMPY_STATS_THRESHOLD:
+            arr = np.asarray(scores, dtype=np.float64)
+            return {
+                'mean': round(float(arr.mean()), 4),
+                'median': round(float(np.median(arr)), 4),
+                'min': round(float(arr.min()), 4),
+                'max': round(float(arr.max()), 4),
+                'count': n
+            }
+        
         sorted_scores = sorted(scores)
-        n = len(sorted_scores)
         
         # Calculate median
         if n % 2 == 0:
@@ -239,8 +525,7 @@ class DynamicLeaderboardGenerator:
         """
         try:
             output_path = os.path.join(session_dir, 'leaderboard.json')
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(leaderboard_data, f, indent=2)
+            write_json_atomic(output_path, leaderboard_data)
             logger.info(f"Saved leaderboard to: {output_path}")
         except Exception as e:
             logger.warning(f"Failed to save leaderboard to session: {e}")
@@ -6,14 +6,53 @@ Compatible with the leaderboard system's expected format
 """
 
 import os
-import json
 import logging
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 
+try:
+    from ._json_io import write_json_atomic
+except ImportError:
+    from _json_io import write_json_atomic
+
 logger = logging.getLogger(__name__)
 
+# Profiles analyzed concurrently (each analysis is a series of GitHub API calls)
+GITHUB_ANALYSIS_WORKERS = 8
+
+# GitHub usernames are 1-39 alphanumerics, with single hyphens allowed
+# between them
+_GH_USERNAME = r'[a-zA-Z0-9](?:[a-zA-Z0-9]|-(?=[a-zA-Z0-9])){0,38}'
+
+# What precedes the username, in order of precedence: github.com/username,
+# "GitHub: username" / "GitHub - username", then "GitHub @username"
+_GH_PREFIXES = {
+    'url': r'github\.com/',
+    'label': r'GitHub\s*[:\-]\s*@?',
+    'at': r'(?:GitHub|Git)\s+@',
+}
+
+# All three forms fused so the text is normally scanned once, plus each
+# form on its own for resolving precedence; compiled once at import
+_GH_COMBINED_RE = re.compile(
+    '|'.join(f'{prefix}(?P<{kind}>{_GH_USERNAME})' for kind, prefix in _GH_PREFIXES.items()),
+    re.IGNORECASE
+)
+_GH_RES = {
+    kind: re.compile(f'{prefix}({_GH_USERNAME})', re.IGNORECASE)
+    for kind, prefix in _GH_PREFIXES.items()
+}
+
+# Every form starts with "git", so this literal scan rejects resumes without
+# any GitHub mention cheaply and tells the fused scan where to start
+_GH_HINT_RE = re.compile('git', re.IGNORECASE)
+
+# github.com pages that look like usernames in a URL
+_GH_URL_FALSE_POSITIVES = frozenset({'features', 'pricing', 'about', 'login', 'signup'})
+
 
 class GitHubAnalysisGenerator:
     """
@@ -30,6 +69,14 @@ class GitHubAnalysisGenerator:
         """
         self.github_service = github_service
         
+        # GitHubService keeps per-profile state in its fetcher, so profiles are
+        # only analyzed concurrently when each worker can create its own
+        self._service_factory = None
+        self._local = threading.local()
+        
+        # Shared analysis_date for every report in the batch being generated
+        self._batch_timestamp = None
+        
         # Import github_service if not provided
         if not self.github_service:
             try:
@@ -37,6 +84,7 @@ class GitHubAnalysisGenerator:
                 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'services'))
                 from github_service import create_github_service
                 self.github_service = create_github_service()
+                self._service_factory = create_github_service
                 logger.info("GitHub service initialized")
             except Exception as e:
                 logger.warning(f"Failed to initialize GitHub service: {e}")
@@ -60,26 +108,29 @@ class GitHubAnalysisGenerator:
         if not resume_text:
             return None
         
-        # Pattern 1: github.com/username
-        pattern1 = r'github\.com/([a-zA-Z0-9](?:[a-zA-Z0-9]|-(?=[a-zA-Z0-9])){0,38})'
-        match = re.search(pattern1, resume_text, re.IGNORECASE)
-        if match:
-            username = match.group(1)
-            # Filter out common false positives
-            if username.lower() not in ['features', 'pricing', 'about', 'login', 'signup']:
-                return username
+        hint = _GH_HINT_RE.search(resume_text)
+        if not hint:
+            return None
         
-        # Pattern 2: GitHub: username or GitHub - username
-        pattern2 = r'GitHub\s*[:\-]\s*@?([a-zA-Z0-9](?:[a-zA-Z0-9]|-(?=[a-zA-Z0-9])){0,38})'
-        match = re.search(pattern2, resume_text, re.IGNORECASE)
-        if match:
-            return match.group(1)
+        match = _GH_COMBINED_RE.search(resume_text, hint.start())
+        if not match:
+            return None
         
-        # Pattern 3: @username in GitHub context
-        pattern3 = r'(?:GitHub|Git)\s+@([a-zA-Z0-9](?:[a-zA-Z0-9]|-(?=[a-zA-Z0-9])){0,38})'
-        match = re.search(pattern3, resume_text, re.IGNORECASE)
-        if match:
-            return match.group(1)
+        # Each form's first match counts, in order of precedence. Nothing
+        # matches before the combined scan's match, so any other form only
+        # needs searching from there on
+        for kind in _GH_PREFIXES:
+            if kind == match.lastgroup:
+                username = match.group(kind)
+            else:
+                other = _GH_RES[kind].search(resume_text, match.start())
+                username = other.group(1) if other else None
+            
+            # Filter out common false positives
+            if kind == 'url' and username and username.lower() in _GH_URL_FALSE_POSITIVES:
+                continue
+            if username:
+                return username
         
         return None
     
@@ -98,13 +149,15 @@ class GitHubAnalysisGenerator:
         Returns:
             dict: Analysis results compatible with leaderboard format
         """
-        if not self.github_service:
+        github_service = getattr(self._local, 'github_service', self.github_service)
+        
+        if not github_service:
             logger.warning("GitHub service not available")
             return self._create_minimal_analysis(username, error="GitHub service not available")
         
         try:
             # Analyze profile using GitHub service
-            result = self.github_service.analyze_profile(
+            result = github_service.analyze_profile(
                 username,
                 job_requirements=job_requirements,
                 max_repos=20
@@ -122,6 +175,14 @@ class GitHubAnalysisGenerator:
             logger.error(f"Error analyzing GitHub profile {username}: {e}")
             return self._create_minimal_analysis(username, error=str(e))
     
+    def _init_worker(self):
+        """Give an analysis worker thread its own GitHub service"""
+        try:
+            self._local.github_service = self._service_factory()
+        except Exception as e:
+            logger.warning(f"Failed to initialize GitHub service for worker: {e}")
+            self._local.github_service = None
+    
     def _transform_to_leaderboard_format(
         self,
         username: str,
@@ -149,7 +210,7 @@ class GitHubAnalysisGenerator:
         # Build leaderboard-compatible structure
         leaderboard_format = {
             'username': username,
-            'analysis_date': datetime.now().isoformat(),
+            'analysis_date': self._batch_timestamp or datetime.now().isoformat(),
             'profile': {
                 'name': profile.get('name'),
                 'bio': profile.get('bio'),
@@ -193,7 +254,7 @@ class GitHubAnalysisGenerator:
         """
         return {
             'username': username,
-            'analysis_date': datetime.now().isoformat(),
+            'analysis_date': self._batch_timestamp or datetime.now().isoformat(),
             'error': error,
             'profile': {},
             'metrics': {
@@ -230,9 +291,26 @@ class GitHubAnalysisGenerator:
         Returns:
             dict: Summary of generated analyses
         """
+        self._batch_timestamp = datetime.now().isoformat()
+        try:
+            return self._generate_analyses(candidates, job_requirements, session_dir, skip_on_error)
+        finally:
+            self._batch_timestamp = None
+    
+    def _generate_analyses(
+        self,
+        candidates: List[Dict[str, Any]],
+        job_requirements: Optional[Dict[str, Any]],
+        session_dir: str,
+        skip_on_error: bool
+    ) -> Dict[str, Any]:
+        """Body of generate_analyses_for_candidates, run with the batch timestamp set"""
         reports_dir = os.path.join(session_dir, 'reports')
         os.makedirs(reports_dir, exist_ok=True)
         
+        # Report paths are this directory plus the file name, joined once
+        reports_prefix = os.path.join(reports_dir, '')
+        
         logger.info(f"Generating GitHub analyses for {len(candidates)} candidates")
         
         analyses_generated = 0
@@ -241,60 +319,79 @@ class GitHubAnalysisGenerator:
         
         results = []
         
+        # Extract GitHub usernames up front so the profiles can be analyzed
+        # concurrently, then handle the candidates in their original order
+        github_usernames = []
         for candidate in candidates:
             name = candidate.get('name', 'Unknown')
-            resume_text = candidate.get('text', '')
+            github_username = self.extract_github_username(candidate.get('text', ''))
+            github_usernames.append(github_username)
             
-            # Extract GitHub username
-            github_username = self.extract_github_username(resume_text)
-            
-            if not github_username:
-                logger.info(f"No GitHub username found for candidate: {name}")
-                analyses_skipped += 1
-                results.append({
-                    'candidate': name,
-                    'status': 'skipped',
-                    'reason': 'No GitHub username found'
-                })
-                continue
-            
-            logger.info(f"Found GitHub username for {name}: {github_username}")
+            if github_username:
+                logger.info(f"Found GitHub username for {name}: {github_username}")
+        
+        if self._service_factory:
+            executor = ThreadPoolExecutor(max_workers=GITHUB_ANALYSIS_WORKERS, initializer=self._init_worker)
+        else:
+            executor = ThreadPoolExecutor(max_workers=1)
+        
+        with executor:
+            futures = [
+                executor.submit(self.analyze_github_profile, github_username, job_requirements)
+                if github_username else None
+                for github_username in github_usernames
+            ]
             
-            try:
-                # Analyze GitHub profile
-                analysis = self.analyze_github_profile(github_username, job_requirements)
-                
-                # Save to JSON file
-                json_filename = f"analysis_{github_username}.json"
-                json_path = os.path.join(reports_dir, json_filename)
-                
-                with open(json_path, 'w', encoding='utf-8') as f:
-                    json.dump(analysis, f, indent=2)
-                
-                logger.info(f"✅ Saved analysis for {github_username} to {json_filename}")
-                
-                analyses_generated += 1
-                results.append({
-                    'candidate': name,
-                    'github_username': github_username,
-                    'status': 'success',
-                    'file': json_filename,
-                    'score': analysis['metrics']['overall_score']
-                })
-                
-            except Exception as e:
-                logger.error(f"Failed to generate analysis for {name} ({github_username}): {e}")
-                analyses_failed += 1
+            for candidate, github_username, future in zip(candidates, github_usernames, futures):
+                name = candidate.get('name', 'Unknown')
                 
-                if not skip_on_error:
-                    raise
+                if not github_username:
+                    logger.info(f"No GitHub username found for candidate: {name}")
+                    analyses_skipped += 1
+                    results.append({
+                        'candidate': name,
+                        'status': 'skipped',
+                        'reason': 'No GitHub username found'
+                    })
+                    continue
                 
-                results.append({
-                    'candidate': name,
-                    'github_username': github_username,
-                    'status': 'failed',
-                    'error': str(e)
-                })
+                try:
+                    # Wait for the GitHub profile analysis
+                    analysis = future.result()
+                    
+                    # Save to JSON file
+                    json_filename = f"analysis_{github_username}.json"
+                    json_path = reports_prefix + json_filename
+                    
+                    write_json_atomic(json_path, analysis)
+                    
+                    logger.info(f"✅ Saved analysis for {github_username} to {json_filename}")
+                    
+                    analyses_generated += 1
+                    results.append({
+                        'candidate': name,
+                        'github_username': github_username,
+                        'status': 'success',
+                        'file': json_filename,
+                        'score': analysis['metrics']['overall_score']
+                    })
+                    
+                except Exception as e:
+                    logger.error(f"Failed to generate analysis for {name} ({github_username}): {e}")
+                    analyses_failed += 1
+                    
+                    if not skip_on_error:
+                        for pending in futures:
+                            if pending:
+                                pending.cancel()
+                        raise
+                    
+                    results.append({
+                        'candidate': name,
+                        'github_username': github_username,
+                        'status': 'failed',
+                        'error': str(e)
+                    })
         
         summary = {
             'success': True,
@@ -8,13 +8,18 @@ Compatible with the leaderboard system's expected format
 import os
 import csv
 import logging
-from typing import Dict, List, Any, Optional
-from sklearn.feature_extraction.text import TfidfVectorizer
+from typing import Dict, List, Any, Optional, Tuple
+from sklearn.feature_extraction.text import TfidfVectorizer, HashingVectorizer, TfidfTransformer
 from sklearn.metrics.pairwise import cosine_similarity
 import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# From this many resumes on, _score_batch hashes terms into a fixed feature
+# space instead of building a vocabulary
+HASHING_MIN_CANDIDATES = 50
+HASHING_FEATURES = 2 ** 15
+
 
 class LinkedInScoreGenerator:
     """
@@ -78,6 +83,72 @@ class LinkedInScoreGenerator:
             logger.error(f"Error calculating similarity score: {e}")
             return 0.0
     
+    def _score_batch(
+        self,
+        resume_texts: List[str],
+        job_description: str
+    ) -> np.ndarray:
+        """
+        Calculate the similarity of every resume to the job description at once
+        
+        Fits one TF-IDF vectorizer over the job description and all resumes.
+        Its rows are L2-normalized, so a sparse dot product with the job
+        description row gives the cosine similarities directly. Large batches
+        hash terms (HashingVectorizer + TfidfTransformer) rather than build
+        and cap a vocabulary.
+        
+        Args:
+            resume_texts: Full text content of each resume
+            job_description: Job description text
+            
+        Returns:
+            np.ndarray: One score between 0 and 1 per resume (0 for empty resumes)
+        """
+        scores = np.zeros(len(resume_texts))
+        
+        indices = [i for i, text in enumerate(resume_texts) if text and text.strip()]
+        if len(indices) < len(resume_texts):
+            logger.warning(f"{len(resume_texts) - len(indices)} empty resume texts provided")
+        
+        if not indices or not job_description or not job_description.strip():
+            return scores
+        
+        vectorizer = TfidfVectorizer(
+            max_features=500,
+            stop_words='english',
+            ngram_range=(1, 2),
+            min_df=1
+        )
+        
+        # A job description with no terms left after stop-word removal is a
+        # zero vector, so every resume would score 0 - skip the fit entirely
+        if not vectorizer.build_analyzer()(job_description):
+            logger.warning("Job description has no scorable terms")
+            return scores
+        
+        documents = [job_description] + [resume_texts[i] for i in indices]
+        
+        try:
+            if len(indices) >= HASHING_MIN_CANDIDATES:
+                counts = HashingVectorizer(
+                    n_features=HASHING_FEATURES,
+                    stop_words='english',
+                    ngram_range=(1, 2),
+                    alternate_sign=False,
+                    norm=None
+                ).transform(documents)
+                tfidf_matrix = TfidfTransformer().fit_transform(counts)
+            else:
+                tfidf_matrix = vectorizer.fit_transform(documents)
+        except ValueError as e:
+            logger.warning(f"Vectorization failed: {e}")
+            return scores
+        
+        similarities = (tfidf_matrix[1:] @ tfidf_matrix[0:1].T).toarray().ravel()
+        scores[indices] = np.clip(similarities, 0.0, 1.0)
+        
+        return scores
+    
     def generate_scores_for_candidates(
         self,
         candidates: List[Dict[str, Any]],
@@ -98,6 +169,22 @@ class LinkedInScoreGenerator:
         Raises:
             ValueError: If candidates list is empty or invalid
         """
+        csv_path, _ = self._write_scores(candidates, job_description, session_dir)
+        return csv_path
+    
+    def _write_scores(
+        self,
+        candidates: List[Dict[str, Any]],
+        job_description: str,
+        session_dir: str
+    ) -> Tuple[str, np.ndarray]:
+        """
+        Score candidates and write results.csv
+        
+        Returns:
+            tuple: (path to results.csv, the scores written in file order,
+            descending and rounded to 4 decimal places)
+        """
         if not candidates:
             raise ValueError("Candidates list cannot be empty")
         
@@ -106,44 +193,46 @@ class LinkedInScoreGenerator:
         
         logger.info(f"Generating scores for {len(candidates)} candidates")
         
-        # Calculate scores for each candidate
-        results = []
-        for candidate in candidates:
-            name = candidate.get('name', 'Unknown')
-            resume_text = candidate.get('text', '')
-            
-            # Calculate similarity score
-            score = self.calculate_similarity_score(resume_text, job_description)
-            
-            results.append({
-                'Candidate': name,
-                'Score': round(score, 4)  # Round to 4 decimal places
-            })
-            
-            logger.debug(f"Candidate: {name}, Score: {score:.4f}")
+        names = [candidate.get('name', 'Unknown') for candidate in candidates]
+        texts = [candidate.get('text', '') for candidate in candidates]
+        
+        # Calculate scores for all candidates in one batch
+        try:
+            scores = self._score_batch(texts, job_description)
+        except Exception as e:
+            logger.error(f"Error calculating similarity scores: {e}")
+            scores = np.zeros(len(candidates))
+        
+        # (Candidate, Score) rows in results.csv column order, rounded to 4
+        # decimal places
+        results = [(name, round(score, 4)) for name, score in zip(names, scores.tolist())]
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            for name, score in zip(names, scores.tolist()):
+                logger.debug(f"Candidate: {name}, Score: {score:.4f}")
         
         # Sort by score (descending)
-        results.sort(key=lambda x: x['Score'], reverse=True)
+        results.sort(key=lambda row: row[1], reverse=True)
         
         # Save to CSV in leaderboard format
         csv_path = os.path.join(session_dir, 'results.csv')
         
         try:
             with open(csv_path, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=['Candidate', 'Score'])
-                writer.writeheader()
+                writer = csv.writer(f)
+                writer.writerow(('Candidate', 'Score'))
                 writer.writerows(results)
             
             logger.info(f"✅ Saved LinkedIn scores to: {csv_path}")
             
             # Log statistics
-            scores = [r['Score'] for r in results]
-            if scores:
-                logger.info(f"Score statistics - Min: {min(scores):.4f}, "
-                          f"Max: {max(scores):.4f}, "
-                          f"Mean: {np.mean(scores):.4f}")
+            scores = np.fromiter((score for _, score in results), dtype=np.float64, count=len(results))
+            if scores.size:
+                logger.info(f"Score statistics - Min: {scores.min():.4f}, "
+                          f"Max: {scores.max():.4f}, "
+                          f"Mean: {scores.mean():.4f}")
             
-            return csv_path
+            return csv_path, scores
             
         except Exception as e:
             logger.error(f"Failed to save results.csv: {e}")
@@ -228,25 +317,20 @@ class LinkedInScoreGenerator:
         
         logger.info(f"Job description length: {len(job_description)} characters")
         
-        # Generate scores
-        csv_path = self.generate_scores_for_candidates(
+        # Generate scores; statistics come from the scores just written
+        csv_path, scores = self._write_scores(
             candidates,
             job_description,
             session_dir
         )
         
-        # Calculate statistics
-        with open(csv_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            scores = [float(row['Score']) for row in reader]
-        
         return {
             'success': True,
             'csv_path': csv_path,
             'total_candidates': len(scores),
-            'average_score': round(np.mean(scores), 4) if scores else 0,
-            'max_score': round(max(scores), 4) if scores else 0,
-            'min_score': round(min(scores), 4) if scores else 0
+            'average_score': round(float(scores.mean()), 4) if scores.size else 0,
+            'max_score': round(float(scores.max()), 4) if scores.size else 0,
+            'min_score': round(float(scores.min()), 4) if scores.size else 0
         }
 
 
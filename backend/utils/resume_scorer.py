@@ -7,15 +7,23 @@ Converted from Colab script to standalone utility
 
 import os
 import re
+import itertools
 from typing import List, Dict, Optional, Tuple
 from pathlib import Path
 import logging
 
+try:
+    from ._regex_patterns import NONBLANK_LINE_RE
+except ImportError:
+    from _regex_patterns import NONBLANK_LINE_RE
+
 logger = logging.getLogger(__name__)
 
+# Lines containing any of these are headers or contact details, not names
+_NAME_HEADER_RE = re.compile(r'resume|curriculum|cv|contact|email|phone|address', re.IGNORECASE)
+
 try:
     from sklearn.feature_extraction.text import TfidfVectorizer
-    from sklearn.metrics.pairwise import cosine_similarity
     SKLEARN_AVAILABLE = True
 except ImportError:
     SKLEARN_AVAILABLE = False
@@ -36,6 +44,23 @@ class ResumeScorer:
             ngram_range=(1, 2),
             min_df=1
         )
+        
+        # Vocabulary pinned by set_corpus_vocabulary; while set, score_resumes
+        # only transforms instead of refitting on every batch
+        self._fitted_vocab = None
+    
+    def set_corpus_vocabulary(self, texts: List[str]) -> None:
+        """
+        Fit the vectorizer once on a representative corpus
+        
+        Later score_resumes calls reuse this vocabulary and IDF weights
+        (terms outside it are ignored) unless called with refit=True.
+        
+        Args:
+            texts: Documents to fit on, e.g. the job description and known resumes
+        """
+        self.vectorizer.fit(texts)
+        self._fitted_vocab = self.vectorizer.vocabulary_
     
     def clean_name_from_filename(self, filename: str) -> str:
         """Extract and clean candidate name from filename"""
@@ -56,17 +81,12 @@ class ResumeScorer:
         if not text:
             return fallback
         
-        lines = [line.strip() for line in text.split('\n') if line.strip()]
-        
-        if not lines:
-            return fallback
-        
-        # Usually the name is in the first 3 lines
-        for line in lines[:3]:
+        # Usually the name is in the first 3 lines (only those are scanned)
+        for match in itertools.islice(NONBLANK_LINE_RE.finditer(text), 3):
+            line = match.group(1)
+            
             # Skip lines that look like headers or sections
-            if len(line) > 50 or any(keyword in line.lower() for keyword in [
-                'resume', 'curriculum', 'cv', 'contact', 'email', 'phone', 'address'
-            ]):
+            if len(line) > 50 or _NAME_HEADER_RE.search(line):
                 continue
             
             # Check if line looks like a name (2-4 words, reasonable length)
@@ -80,7 +100,8 @@ class ResumeScorer:
         self,
         job_description: str,
         resumes: List[Dict[str, str]],
-        top_n: Optional[int] = None
+        top_n: Optional[int] = None,
+        refit: bool = False
     ) -> List[Dict[str, any]]:
         """
         Score and rank resumes against job description
@@ -89,6 +110,7 @@ class ResumeScorer:
             job_description: Job description text
             resumes: List of dicts with 'text' and 'filename' or 'name'
             top_n: Return only top N results (None = all)
+            refit: Refit a vocabulary pinned by set_corpus_vocabulary on this batch
             
         Returns:
             List of scored resumes sorted by score descending
@@ -104,13 +126,19 @@ class ResumeScorer:
         
         try:
             # Compute TF-IDF vectors
-            tfidf_matrix = self.vectorizer.fit_transform(all_texts)
+            if self._fitted_vocab is not None and not refit:
+                tfidf_matrix = self.vectorizer.transform(all_texts)
+            else:
+                tfidf_matrix = self.vectorizer.fit_transform(all_texts)
+                if self._fitted_vocab is not None:
+                    self._fitted_vocab = self.vectorizer.vocabulary_
             
-            # Compute cosine similarity between job description and each resume
+            # Compute cosine similarity between job description and each resume;
+            # TF-IDF rows are already L2-normalized, so a dot product suffices
             job_vector = tfidf_matrix[0:1]
             resume_vectors = tfidf_matrix[1:]
             
-            similarities = cosine_similarity(job_vector, resume_vectors)[0]
+            similarities = (resume_vectors @ job_vector.T).toarray().ravel()
             
             # Build results
             results = []
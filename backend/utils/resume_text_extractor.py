@@ -6,83 +6,247 @@ Converted from Colab script to standalone utility
 """
 
 import os
+import mmap
+import hashlib
+import threading
+import importlib.util
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Optional, Dict
+from typing import Optional, Dict, List
 import logging
 
 logger = logging.getLogger(__name__)
 
-# Optional imports - gracefully handle if not available
-try:
-    import pdfplumber
-    import PyPDF2
-    PYPDF2_AVAILABLE = True
-except ImportError:
-    PYPDF2_AVAILABLE = False
+# Below this size mmap setup costs more than a buffered read
+TXT_MMAP_MIN_BYTES = 64 * 1024
+
+# Part of every extraction cache key; bump it whenever extraction output
+# changes (a new backend, different cleanup) so stale cached text is ignored
+EXTRACTOR_VERSION = 2
+
+# Optional imports - probed without importing; the heavy modules (pdfminer,
+# Pillow, lxml) are loaded on first use so TXT-only callers and pool workers
+# start fast
+PDFIUM_AVAILABLE = importlib.util.find_spec('pypdfium2') is not None
+if not PDFIUM_AVAILABLE:
+    logger.warning("pypdfium2 not available. Falling back to pdfplumber for PDFs.")
+
+PYPDF2_AVAILABLE = (importlib.util.find_spec('pdfplumber') is not None
+                    and importlib.util.find_spec('PyPDF2') is not None)
+if not PYPDF2_AVAILABLE:
     logger.warning("PyPDF2 or pdfplumber not available. PDF extraction disabled.")
 
-try:
-    from docx import Document
-    DOCX_AVAILABLE = True
-except ImportError:
-    DOCX_AVAILABLE = False
+DOCX_AVAILABLE = importlib.util.find_spec('docx') is not None
+if not DOCX_AVAILABLE:
     logger.warning("python-docx not available. DOCX extraction disabled.")
 
+# Loaded modules; None until first use, False if the import failed
+_PDFIUM = None
+_PDF_MODS = None
+_DOCX_DOCUMENT = None
+
+
+def _load_pdfium():
+    """Import pypdfium2 on first use"""
+    global _PDFIUM
+    if _PDFIUM is None:
+        try:
+            import pypdfium2
+            _PDFIUM = pypdfium2
+        except ImportError:
+            _PDFIUM = False
+    return _PDFIUM
+
+
+def _load_pdf_modules():
+    """Import pdfplumber and PyPDF2 on first use"""
+    global _PDF_MODS
+    if _PDF_MODS is None:
+        try:
+            import pdfplumber
+            import PyPDF2
+            _PDF_MODS = (pdfplumber, PyPDF2)
+        except ImportError:
+            _PDF_MODS = False
+    return _PDF_MODS
+
+
+def _load_docx_document():
+    """Import python-docx's Document on first use"""
+    global _DOCX_DOCUMENT
+    if _DOCX_DOCUMENT is None:
+        try:
+            from docx import Document
+            _DOCX_DOCUMENT = Document
+        except ImportError:
+            _DOCX_DOCUMENT = False
+    return _DOCX_DOCUMENT
+
 
 class ResumeTextExtractor:
     """Extract text from various resume file formats"""
     
-    def __init__(self):
-        """Initialize the extractor"""
-        self.supported_formats = {'.txt', '.pdf', '.docx', '.doc'}
+    def __init__(self, cache_dir: Optional[str] = None):
+        """
+        Initialize the extractor
+        
+        Args:
+            cache_dir: Directory for extracted text keyed by a hash of the
+                file contents; caching is disabled when None
+        """
+        # Extension -> extractor; the single source of supported formats
+        self._dispatch = {
+            '.pdf': self.extract_from_pdf,
+            '.docx': self.extract_from_docx,
+            '.doc': self.extract_from_doc,
+            '.txt': self.extract_from_txt
+        }
+        self.supported_formats = frozenset(self._dispatch)
+        self.cache_dir = cache_dir
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
     
-    def extract_from_pdf(self, file_path: str) -> str:
-        """Extract text from PDF using pdfplumber first, fallback to PyPDF2"""
-        if not PYPDF2_AVAILABLE:
+    def _file_digest(self, file_path: str, file_ext: str) -> str:
+        """BLAKE2b digest of the file bytes, salted with the extractor version and extension"""
+        hasher = hashlib.blake2b(f"{EXTRACTOR_VERSION}:{file_ext}".encode(), digest_size=16)
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                hasher.update(chunk)
+        return hasher.hexdigest()
+    
+    def _read_cached(self, digest: str) -> Optional[str]:
+        """Return cached text for a digest, or None on a miss"""
+        try:
+            with open(os.path.join(self.cache_dir, f"{digest}.txt"), 'rb') as f:
+                return f.read().decode('utf-8', 'surrogatepass')
+        except (OSError, ValueError):
+            return None
+    
+    def _write_cached(self, digest: str, text: str):
+        """Store extracted text atomically so concurrent readers never see a partial file"""
+        cache_path = os.path.join(self.cache_dir, f"{digest}.txt")
+        # Unique per thread too: extract_many(use_threads=True) may extract
+        # the same document twice at once
+        tmp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            # Bytes round-trip exactly: no newline translation, and lone
+            # surrogates from lenient decoders survive
+            data = text.encode('utf-8', 'surrogatepass')
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, cache_path)
+        except (OSError, ValueError) as e:
+            logger.debug(f"Could not cache extraction result {digest}: {e}")
+        finally:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+    
+    def _extract_with_pdfium(self, file_path: str) -> str:
+        """Extract text with PDFium's native text engine"""
+        pdfium = _load_pdfium()
+        if not pdfium:
+            return ""
+        
+        pages = []
+        try:
+            pdf = pdfium.PdfDocument(file_path)
+            try:
+                for page in pdf:
+                    textpage = page.get_textpage()
+                    pages.append(textpage.get_text_range())
+                    textpage.close()
+                    page.close()
+            finally:
+                pdf.close()
+        except Exception as e:
+            logger.debug(f"pypdfium2 failed for {file_path}: {e}")
             return ""
         
+        # PDFium emits CRLF line breaks; match the other backends
+        return "\n".join(pages).replace("\r\n", "\n")
+    
+    def extract_from_pdf(self, file_path: str) -> str:
+        """Extract text from PDF using pypdfium2 first, fallback to pdfplumber then PyPDF2"""
         text = ""
         
-        # Try pdfplumber first (better layout preservation)
+        # Try pypdfium2 first (C++ engine, far faster than pdfminer-based pdfplumber)
+        if PDFIUM_AVAILABLE:
+            text = self._extract_with_pdfium(file_path)
+        
+        pdf_mods = _load_pdf_modules() if PYPDF2_AVAILABLE else False
+        if text.strip() or not pdf_mods:
+            return text.strip()
+        pdfplumber, PyPDF2 = pdf_mods
+        
+        # Fall back to pdfplumber (better layout preservation)
+        parts = []
         try:
+            # laparams stays None: passing any dict turns on pdfminer's
+            # layout analysis, which resumes do not need
             with pdfplumber.open(file_path) as pdf:
                 for page in pdf.pages:
-                    page_text = page.extract_text()
+                    page_text = page.extract_text(layout=False, x_tolerance=3, y_tolerance=3)
+                    # Release the page's cached objects so long PDFs stay bounded
+                    page.close()
                     if page_text:
-                        text += page_text + "\n"
+                        parts.append(page_text)
         except Exception as e:
             logger.debug(f"pdfplumber failed for {file_path}: {e}")
         
+        text = "\n".join(parts).strip()
+        
         # Fallback to PyPDF2 if no text extracted
-        if not text.strip():
+        if not text:
+            parts = []
             try:
                 with open(file_path, 'rb') as f:
                     reader = PyPDF2.PdfReader(f)
                     for page in reader.pages:
                         page_text = page.extract_text()
                         if page_text:
-                            text += page_text + "\n"
+                            parts.append(page_text)
             except Exception as e:
                 logger.error(f"PyPDF2 error for {file_path}: {e}")
+            text = "\n".join(parts).strip()
         
-        return text.strip()
+        return text
     
     def extract_from_docx(self, file_path: str) -> str:
         """Extract text from DOCX file"""
-        if not DOCX_AVAILABLE:
+        Document = _load_docx_document() if DOCX_AVAILABLE else False
+        if not Document:
             return ""
         
         try:
             doc = Document(file_path)
-            text = "\n".join([paragraph.text for paragraph in doc.paragraphs])
+            # Skip empty paragraphs left by Word styling; .text is rebuilt from
+            # runs on every access, so read it once per paragraph
+            text = "\n".join(filter(None, (paragraph.text for paragraph in doc.paragraphs)))
             return text.strip()
         except Exception as e:
             logger.error(f"DOCX extraction error for {file_path}: {e}")
             return ""
     
+    def extract_from_doc(self, file_path: str) -> str:
+        """Legacy DOC files require antiword or similar - skip for now"""
+        logger.warning(f"DOC format not fully supported: {file_path}")
+        return ""
+    
     def extract_from_txt(self, file_path: str) -> str:
         """Extract text from plain text file"""
         try:
+            with open(file_path, 'rb') as f:
+                size = os.fstat(f.fileno()).st_size
+                if size >= TXT_MMAP_MIN_BYTES:
+                    # Decode straight from the mapped pages in one C call
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        text = str(mm, 'utf-8', 'ignore')
+                    # Match text-mode universal newline translation
+                    return text.replace('\r\n', '\n').replace('\r', '\n').strip()
+            
             with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
                 return f.read().strip()
         except Exception as e:
@@ -115,7 +279,8 @@ class ResumeTextExtractor:
         
         file_ext = path.suffix.lower()
         
-        if file_ext not in self.supported_formats:
+        handler = self._dispatch.get(file_ext)
+        if handler is None:
             return {
                 'success': False,
                 'text': '',
@@ -124,18 +289,24 @@ class ResumeTextExtractor:
             }
         
         text = ""
+        digest = None
         
         try:
-            if file_ext == '.pdf':
-                text = self.extract_from_pdf(str(path))
-            elif file_ext == '.docx':
-                text = self.extract_from_docx(str(path))
-            elif file_ext == '.doc':
-                # .doc files require antiword or similar - skip for now
-                logger.warning(f"DOC format not fully supported: {file_path}")
-                text = ""
-            elif file_ext == '.txt':
-                text = self.extract_from_txt(str(path))
+            if self.cache_dir:
+                digest = self._file_digest(str(path), file_ext)
+                cached = self._read_cached(digest)
+                if cached is not None:
+                    return {
+                        'success': True,
+                        'text': cached,
+                        'format': file_ext,
+                        'error': None
+                    }
+            
+            text = handler(str(path))
+            
+            if text and digest:
+                self._write_cached(digest, text)
             
             return {
                 'success': bool(text),
@@ -169,6 +340,41 @@ def extract_resume_text(file_path: str) -> str:
     return result.get('text', '')
 
 
+def _extract_one(file_path: str, cache_dir: Optional[str] = None) -> Dict[str, any]:
+    """Worker entry point; module-level so it pickles for process pools"""
+    return ResumeTextExtractor(cache_dir=cache_dir).extract_text(file_path)
+
+
+def extract_many(file_paths: List[str], max_workers: int = min(os.cpu_count() or 1, 4),
+                 use_threads: bool = False, cache_dir: Optional[str] = None) -> List[Dict[str, any]]:
+    """
+    Extract text from several resume files in parallel
+    
+    PDF parsing is CPU-bound pure Python, so processes are used by default
+    to get around the GIL. Pass use_threads=True for TXT/DOCX-heavy batches
+    where I/O dominates and process start-up would not pay off.
+    
+    Args:
+        file_paths: Paths to resume files
+        max_workers: Maximum number of worker processes or threads
+        use_threads: Use a thread pool instead of a process pool
+        cache_dir: Optional extraction cache directory shared by all workers
+        
+    Returns:
+        One extract_text result per path, in input order
+    """
+    file_paths = list(file_paths)
+    workers = min(max_workers, len(file_paths))
+    
+    if workers <= 1:
+        extractor = ResumeTextExtractor(cache_dir=cache_dir)
+        return [extractor.extract_text(path) for path in file_paths]
+    
+    executor_class = ThreadPoolExecutor if use_threads else ProcessPoolExecutor
+    with executor_class(max_workers=workers) as executor:
+        return list(executor.map(partial(_extract_one, cache_dir=cache_dir), file_paths))
+
+
 if __name__ == '__main__':
     import sys
     
@@ -5,15 +5,36 @@ Handles session creation, management, and cleanup for job posting uploads
 """
 
 import os
+import re
 import json
+import time
+import itertools
 import shutil
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Iterator
 from pathlib import Path
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    from ._json_io import write_json_atomic
+except ImportError:
+    from _json_io import write_json_atomic
+
 logger = logging.getLogger(__name__)
 
+# _sanitize_id: spaces and dots become underscores, then anything that is not
+# alphanumeric, '_' or '-' is dropped (\w matches exactly str.isalnum() or '_')
+_SANITIZE_TABLE = str.maketrans({' ': '_', '.': '_'})
+_UNSAFE_ID_CHARS_RE = re.compile(r'[^\w-]')
+
+
 
 class SessionManager:
     """
@@ -29,6 +50,10 @@ class SessionManager:
             base_upload_dir: Base directory for all uploads (e.g., 'backend/uploads')
         """
         self.base_upload_dir = base_upload_dir
+        # Per-session directory layout
+        self._subdirs = ('reports', 'resumes')
+        # Disambiguates sessions created within the same clock tick
+        self._counter = itertools.count()
         os.makedirs(base_upload_dir, exist_ok=True)
         logger.info(f"Session Manager initialized with base dir: {base_upload_dir}")
     
@@ -51,8 +76,10 @@ class SessionManager:
         Returns:
             tuple: (session_id, session_directory_path)
         """
-        # Generate session ID
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S_%f')[:19]  # Include microseconds
+        # Generate session ID from one clock read; the counter keeps IDs
+        # unique even when sessions are created concurrently
+        now_ns = time.time_ns()
+        timestamp = f"{now_ns}_{next(self._counter)}"
         
         # Build session ID components
         components = ['session']
@@ -65,15 +92,15 @@ class SessionManager:
         session_id = '_'.join(components)
         session_dir = os.path.join(self.base_upload_dir, session_id)
         
-        # Create directory structure
-        os.makedirs(session_dir, exist_ok=True)
-        os.makedirs(os.path.join(session_dir, 'reports'), exist_ok=True)
-        os.makedirs(os.path.join(session_dir, 'resumes'), exist_ok=True)
+        # Create directory structure; the first leaf creates session_dir
+        # as a side effect, and Path.mkdir only walks up on ENOENT
+        for subdir in self._subdirs:
+            Path(session_dir, subdir).mkdir(parents=True, exist_ok=True)
         
         # Create metadata
         session_metadata = {
             'session_id': session_id,
-            'created_at': datetime.now().isoformat(),
+            'created_at': datetime.fromtimestamp(now_ns / 1e9).isoformat(),
             'company_id': company_id or 'default',
             'job_id': job_id or 'default',
             'job_title': job_title or 'Unknown Position',
@@ -88,9 +115,7 @@ class SessionManager:
             session_metadata.update(metadata)
         
         # Save metadata
-        metadata_path = os.path.join(session_dir, 'metadata.json')
-        with open(metadata_path, 'w', encoding='utf-8') as f:
-            json.dump(session_metadata, f, indent=2)
+        write_json_atomic(os.path.join(session_dir, 'metadata.json'), session_metadata)
         
         logger.info(f"Created session: {session_id}")
         return session_id, session_dir
@@ -108,11 +133,15 @@ class SessionManager:
         Raises:
             ValueError: If session doesn't exist
         """
-        session_dir = os.path.join(self.base_upload_dir, session_id)
+        session_dir = self._session_dir(session_id)
         if not os.path.exists(session_dir):
             raise ValueError(f"Session not found: {session_id}")
         return session_dir
     
+    def _session_dir(self, session_id: str) -> str:
+        """Session directory path without the existence check"""
+        return os.path.join(self.base_upload_dir, session_id)
+    
     def get_session_metadata(self, session_id: str) -> Dict[str, Any]:
         """
         Load session metadata
@@ -126,14 +155,16 @@ class SessionManager:
         Raises:
             ValueError: If session doesn't exist
         """
-        session_dir = self.get_session_dir(session_id)
+        session_dir = self._session_dir(session_id)
         metadata_path = os.path.join(session_dir, 'metadata.json')
         
-        if not os.path.exists(metadata_path):
+        # Opening the file covers both checks; only a miss needs to tell
+        # them apart
+        try:
+            return self._read_metadata(metadata_path)
+        except (FileNotFoundError, NotADirectoryError):
+            self.get_session_dir(session_id)
             raise ValueError(f"Session metadata not found: {session_id}")
-        
-        with open(metadata_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
     
     def update_session_metadata(
         self,
@@ -151,11 +182,9 @@ class SessionManager:
         metadata.update(updates)
         metadata['updated_at'] = datetime.now().isoformat()
         
-        session_dir = self.get_session_dir(session_id)
-        metadata_path = os.path.join(session_dir, 'metadata.json')
+        metadata_path = os.path.join(self._session_dir(session_id), 'metadata.json')
         
-        with open(metadata_path, 'w', encoding='utf-8') as f:
-            json.dump(metadata, f, indent=2)
+        write_json_atomic(metadata_path, metadata)
         
         logger.debug(f"Updated metadata for session: {session_id}")
     
@@ -198,19 +227,19 @@ class SessionManager:
         sessions = []
         
         # List all session directories
-        for item in os.listdir(self.base_upload_dir):
-            if item.startswith('session_'):
-                try:
-                    metadata = self.get_session_metadata(item)
-                    
-                    # Filter by company if specified
-                    if company_id and metadata.get('company_id') != company_id:
-                        continue
-                    
-                    sessions.append(metadata)
-                except Exception as e:
-                    logger.warning(f"Failed to load session metadata for {item}: {e}")
+        for entry in self._iter_session_entries():
+            item = entry.name
+            try:
+                metadata = self.get_session_metadata(item)
+                
+                # Filter by company if specified
+                if company_id and metadata.get('company_id') != company_id:
                     continue
+                
+                sessions.append(metadata)
+            except Exception as e:
+                logger.warning(f"Failed to load session metadata for {item}: {e}")
+                continue
         
         # Sort by creation date (newest first)
         sessions.sort(key=lambda x: x.get('created_at', ''), reverse=True)
@@ -237,29 +266,50 @@ class SessionManager:
             list: List of deleted (or to-be-deleted) session IDs
         """
         cutoff_date = datetime.now() - timedelta(days=days)
-        deleted_sessions = []
-        
-        for item in os.listdir(self.base_upload_dir):
-            if item.startswith('session_'):
-                try:
-                    metadata = self.get_session_metadata(item)
-                    created_at = datetime.fromisoformat(metadata['created_at'])
-                    
-                    if created_at < cutoff_date:
-                        if dry_run:
-                            logger.info(f"Would delete session: {item} (created: {created_at})")
-                        else:
-                            session_dir = os.path.join(self.base_upload_dir, item)
-                            shutil.rmtree(session_dir)
-                            logger.info(f"Deleted old session: {item}")
-                        
-                        deleted_sessions.append(item)
-                
-                except Exception as e:
-                    logger.warning(f"Failed to process session {item} for cleanup: {e}")
+        cutoff_ts = cutoff_date.timestamp()
+        expired = []
+        
+        # Materialise the listing first; entries are removed as we go
+        for entry in list(self._iter_session_entries()):
+            item = entry.name
+            try:
+                # A session directory is touched by every metadata write, so
+                # a recent mtime rules the session out without parsing JSON
+                if entry.stat().st_mtime >= cutoff_ts:
                     continue
+                
+                metadata = self.get_session_metadata(item)
+                created_at = datetime.fromisoformat(metadata['created_at'])
+                
+                if created_at < cutoff_date:
+                    if dry_run:
+                        logger.info(f"Would delete session: {item} (created: {created_at})")
+                    expired.append(entry)
+            
+            except Exception as e:
+                logger.warning(f"Failed to process session {item} for cleanup: {e}")
+                continue
+        
+        if dry_run or not expired:
+            return [entry.name for entry in expired]
         
-        return deleted_sessions
+        # rmtree is a stream of unlink/rmdir syscalls that release the GIL,
+        # so old sessions are removed concurrently
+        workers = min(32, (os.cpu_count() or 1) * 4, len(expired))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            removed = list(executor.map(self._remove_session_dir, expired))
+        
+        return [entry.name for entry, ok in zip(expired, removed) if ok]
+    
+    def _remove_session_dir(self, entry: os.DirEntry) -> bool:
+        """Delete one expired session directory for cleanup_old_sessions"""
+        try:
+            shutil.rmtree(entry.path)
+        except Exception as e:
+            logger.warning(f"Failed to process session {entry.name} for cleanup: {e}")
+            return False
+        logger.info(f"Deleted old session: {entry.name}")
+        return True
     
     def delete_session(self, session_id: str) -> bool:
         """
@@ -290,19 +340,25 @@ class SessionManager:
         total_sessions = 0
         total_size = 0
         
-        for item in os.listdir(self.base_upload_dir):
-            if item.startswith('session_'):
-                total_sessions += 1
-                session_dir = os.path.join(self.base_upload_dir, item)
-                
-                # Calculate directory size
-                for dirpath, dirnames, filenames in os.walk(session_dir):
-                    for filename in filenames:
-                        filepath = os.path.join(dirpath, filename)
-                        try:
-                            total_size += os.path.getsize(filepath)
-                        except OSError:
-                            pass
+        for entry in self._iter_session_entries():
+            total_sessions += 1
+            
+            # Calculate directory size; DirEntry.stat() reuses the data
+            # from the directory read instead of a stat call per path
+            stack = [entry.path]
+            while stack:
+                try:
+                    with os.scandir(stack.pop()) as children:
+                        for child in children:
+                            if child.is_dir(follow_symlinks=False):
+                                stack.append(child.path)
+                                continue
+                            try:
+                                total_size += child.stat(follow_symlinks=False).st_size
+                            except OSError:
+                                pass
+                except OSError:
+                    pass
         
         return {
             'total_sessions': total_sessions,
@@ -311,6 +367,30 @@ class SessionManager:
             'base_directory': self.base_upload_dir
         }
     
+    def _read_metadata(self, metadata_path: str) -> Dict[str, Any]:
+        """Parse a metadata.json file"""
+        with open(metadata_path, 'rb') as f:
+            data = f.read()
+        if ORJSON_AVAILABLE:
+            try:
+                return orjson.loads(data)
+            except ValueError:
+                # Files written by json.dump may hold NaN/Infinity, which orjson rejects
+                pass
+        return json.loads(data)
+    
+    def _iter_session_entries(self) -> Iterator[os.DirEntry]:
+        """
+        Yield directory entries for all session directories
+        
+        Uses os.scandir so names and entry types come from the directory
+        read itself rather than a stat per item
+        """
+        with os.scandir(self.base_upload_dir) as entries:
+            for entry in entries:
+                if entry.name.startswith('session_') and entry.is_dir():
+                    yield entry
+    
     def _sanitize_id(self, id_string: str) -> str:
         """
         Sanitize ID string for use in filenames
@@ -322,20 +402,10 @@ class SessionManager:
             str: Sanitized ID safe for filesystem
         """
         # Remove/replace unsafe characters
-        safe_chars = []
-        for char in id_string:
-            if char.isalnum() or char in ['-', '_']:
-                safe_chars.append(char)
-            elif char in [' ', '.']:
-                safe_chars.append('_')
-        
-        sanitized = ''.join(safe_chars)
+        sanitized = _UNSAFE_ID_CHARS_RE.sub('', id_string.translate(_SANITIZE_TABLE))
         
         # Limit length
-        if len(sanitized) > 50:
-            sanitized = sanitized[:50]
-        
-        return sanitized.lower()
+        return sanitized[:50].lower()
 
 
 # Convenience function to create a session manager instance